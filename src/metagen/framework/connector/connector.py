@@ -36,6 +36,10 @@ class BaseConnector:
     :vartype _solution_to_builtin: Dict[BaseTypeClass, Any]
     :ivar _builtin_to_solution: A dictionary mapping built-in types to solution types.
     :vartype _builtin_to_solution: Dict[Any, BaseTypeClass]
+    :ivar _type_cache: A dictionary caching the solution type resolved for each definition or built-in class.
+    :vartype _type_cache: Dict[type, BaseTypeClass]
+    :ivar _builtin_cache: A dictionary caching the built-in type resolved for each solution type.
+    :vartype _builtin_cache: Dict[Any, type]
 
     :meth:`__init__`:
         Initializes the BaseConnector object.
@@ -59,6 +63,8 @@ class BaseConnector:
         self._solution_to_domain: Dict[BaseTypeClass, BaseClass] = {}
         self._solution_to_builtin: Dict[BaseTypeClass, Any] = {}
         self._builtin_to_solution: Dict[Any, BaseTypeClass] = {}
+        self._type_cache: Dict[type, BaseTypeClass] = {}
+        self._builtin_cache: Dict[Any, type] = {}
 
         self.register(definitions.BaseDefinition, types.Solution, dict)
         self.register(definitions.IntegerDefinition, types.Integer, int)
@@ -86,6 +92,8 @@ class BaseConnector:
         self._solution_to_domain[solution_type] = domain_type
         self._solution_to_builtin[solution_type] = builtin_type
         self._builtin_to_solution[builtin_type] = solution_type
+        self._type_cache.clear()
+        self._builtin_cache.clear()
 
     def get_type(self, definition: definitions.Base | int | float | str | list | dict | type[definitions.Base | int | float | str | list | dict]) -> type[BaseTypeClass]:
         """
@@ -97,8 +105,25 @@ class BaseConnector:
         :rtype: type[`BaseTypeClass`]
         :raises ValueError: If the definition is not registered in the connector.
         """
+        definition_class: type[definitions.Base | int | float | str | list | dict] = definition if inspect.isclass(definition) else definition.__class__
+        solution_type = self._type_cache.get(definition_class)
+        if solution_type is None:
+            solution_type = self._resolve_type(definition, definition_class)
+            self._type_cache[definition_class] = solution_type
+        return solution_type
+
+    def _resolve_type(self, definition: definitions.Base | int | float | str | list | dict | type[definitions.Base | int | float | str | list | dict], definition_class: type[definitions.Base | int | float | str | list | dict]) -> type[BaseTypeClass]:
+        """
+        Resolves the solution type of a definition class through the registered mappings. It is used by
+        :meth:`get_type` when the class is not cached yet.
+
+        :param definition: The definition object or type for which to retrieve the solution type.
+        :param definition_class: The class of the definition.
+        :return: The corresponding solution type.
+        :rtype: type[`BaseTypeClass`]
+        :raises ValueError: If the definition is not registered in the connector.
+        """
         try:
-            definition_class: type[definitions.Base | int | float | str | list | dict] = definition if inspect.isclass(definition) else definition.__class__
             if issubclass(definition_class, definitions.BaseStructureDefinition):
                 return self._domain_to_solution[definition_class][0]
             if issubclass(definition_class, definitions.Base):
@@ -149,14 +174,30 @@ class BaseConnector:
         :rtype: type[int | float | str | list | dict]
         :raises ValueError: If the solution type is not registered in the connector.
         """
+        solution_class = solution_type if inspect.isclass(
+            solution_type) or isinstance(solution_type, tuple) else solution_type.__class__
+        builtin_type = self._builtin_cache.get(solution_class)
+        if builtin_type is None:
+            builtin_type = self._resolve_builtin(solution_class)
+            self._builtin_cache[solution_class] = builtin_type
+        return builtin_type
+
+    def _resolve_builtin(self, solution_class: type[types.BaseType] | Tuple[type[types.BaseType], str]) -> type[int | float | str | list | dict]:
+        """
+        Resolves the built-in type of a solution class through the registered mappings. It is used by
+        :meth:`get_builtin` when the class is not cached yet.
+
+        :param solution_class: The class of the solution type, or its registration tuple.
+        :return: The corresponding built-in type.
+        :rtype: type[int | float | str | list | dict]
+        :raises ValueError: If the solution type is not registered in the connector.
+        """
         try:
-            solution_type = solution_type if inspect.isclass(
-                solution_type) else solution_type.__class__
-            if issubclass(solution_type, types.BaseType):
-                return self._solution_to_builtin[solution_type]
+            if isinstance(solution_class, tuple) or issubclass(solution_class, types.BaseType):
+                return self._solution_to_builtin[solution_class]
             else:
                 raise ValueError(
-                    f"The object {solution_type} must be an instance of BaseType.")
+                    f"The object {solution_class} must be an instance of BaseType.")
         except KeyError:
             raise ValueError(
-                f"The object {solution_type} has not been registered in the connector.")
+                f"The object {solution_class} has not been registered in the connector.")
@@ -17,7 +17,9 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, cast
+from typing import Any, Dict, Tuple, cast
+
+import numpy as np
 
 from metagen.framework.domain.literals import (DF, METAGEN_TYPE, Attributes, C,
                                                CatAttr, CatVal, D, DefAttr,
@@ -27,12 +29,23 @@ from metagen.framework.domain.literals import (DF, METAGEN_TYPE, Attributes, C,
 from metagen.framework.domain.preconditions import Messages, Preconditions
 
 
+def _in_range(values: np.ndarray, min_value: int | float, max_value: int | float) -> bool:
+    """
+    Check whether all the values of a non-empty numerical array are within a range, by means of two reductions that do
+    not allocate intermediate arrays. The reductions ignore NaN values, which are accepted as the scalar check of each
+    value does.
+    """
+    return not (bool(np.fmin.reduce(values) < min_value) or bool(np.fmax.reduce(values) > max_value))
+
+
 class Base(ABC):
     """
     Abstract base class for metagen definitions with a common interface.
 
     """
 
+    __slots__ = ("_meta_type",)
+
     def __init__(self, meta_type: METAGEN_TYPE):
         """
         Initializes a new instance assigning the metagen internal type.
@@ -60,7 +73,38 @@ class Base(ABC):
         return self._meta_type
 
 
-class IntegerDefinition(Base):
+class _ImmutableDefinition(Base):
+    """
+    Base class of the variable definitions whose attributes can not change once they are initialized. They are compared
+    and hashed by their attributes, so they can be used as keys of memoization caches, and they are shared instead of
+    copied by `copy.copy` and `copy.deepcopy`.
+    """
+
+    __slots__ = ()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if hasattr(self, name):
+            raise AttributeError(f"The attribute {name} of a {type(self).__name__} can not be modified.")
+        object.__setattr__(self, name, value)
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"The attribute {name} of a {type(self).__name__} can not be deleted.")
+
+    def __eq__(self, other: object) -> bool:
+        return type(self) is type(other) and self.get_attributes() == cast(Base, other).get_attributes()
+
+    def __copy__(self) -> _ImmutableDefinition:
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> _ImmutableDefinition:
+        return self
+
+    def __hash__(self) -> int:
+        return hash(tuple(tuple(attribute) if isinstance(attribute, list) else attribute
+                          for attribute in self.get_attributes()))
+
+
+class IntegerDefinition(_ImmutableDefinition):
     """
     Represents an integer type with defined minimum, maximum and step values.
 
@@ -81,6 +125,8 @@ class IntegerDefinition(Base):
     :rtype: IntegerDefinition
     """
 
+    __slots__ = ("__min_value", "__max_value", "__step")
+
     def __init__(self, min_value: int, max_value: int, step: int | None = None):
         """
         Initializes an instance of the IntegerDefinition class with the provided minimum, maximum and step values.
@@ -120,14 +166,7 @@ class IntegerDefinition(Base):
         :return: True if the value is a valid integer within the range of the IntegerDefinition instance, False otherwise.
         :rtype: bool
         """
-        res: bool = True
-
-        if not isinstance(value, int):
-            res = False
-        else:
-            if value < self.__min_value or value > self.__max_value:
-                res = False
-        return res
+        return isinstance(value, int) and not (value < self.__min_value or value > self.__max_value)
 
     def __str__(self):
         """
@@ -141,7 +180,7 @@ class IntegerDefinition(Base):
             ", Step = " + str(self.__step) + "}"
 
 
-class RealDefinition(Base):
+class RealDefinition(_ImmutableDefinition):
     """
     Represents a real number type with defined minimum, maximum and step values.
 
@@ -162,6 +201,8 @@ class RealDefinition(Base):
     :rtype: RealDefinition
     """
 
+    __slots__ = ("__min_value", "__max_value", "__step")
+
     def __init__(self, min_value: float, max_value: float, step: float | None = None):
         """
         Initializes an instance of the RealDefinition class with the provided minimum, maximum and step values.
@@ -200,14 +241,7 @@ class RealDefinition(Base):
         :return: True if the value is a valid real number within the range of the RealDefinition instance, False otherwise.
         :rtype: bool
         """
-        res: bool = True
-
-        if not isinstance(value, float):
-            res = False
-        else:
-            if value < self.__min_value or value > self.__max_value:
-                res = False
-        return res
+        return isinstance(value, float) and not (value < self.__min_value or value > self.__max_value)
 
     def __str__(self):
         """
@@ -221,7 +255,7 @@ class RealDefinition(Base):
             ", Step = " + str(self.__step) + "}"
 
 
-class CategoricalDefinition(Base):
+class CategoricalDefinition(_ImmutableDefinition):
     """
     Represents a categorical attribute with a set of allowed categories.
 
@@ -232,6 +266,8 @@ class CategoricalDefinition(Base):
     :rtype: CategoricalDefinition
     """
 
+    __slots__ = ("__categories", "__category_set")
+
     def __init__(self, categories: CatVal):
         """
         Initialize the CategoricalDefinition instance.
@@ -243,6 +279,7 @@ class CategoricalDefinition(Base):
         Preconditions.Categorical.categories(categories)
         Base.__init__(self, C)
         self.__categories: CatVal = categories
+        self.__category_set: frozenset = frozenset(categories)
 
     def get_attributes(self) -> CatAttr:
         """
@@ -262,11 +299,10 @@ class CategoricalDefinition(Base):
         :return: True if the value is in the allowed categories, False otherwise.
         :rtype: bool
         """
-        res: bool = True
-
-        if value not in self.__categories:
-            res = False
-        return res
+        try:
+            return value in self.__category_set
+        except TypeError:
+            return False
 
     def __str__(self):
         return "[" + super().get_type() + "] " + "{Values = " + str(self.__categories) + "}"
@@ -287,6 +323,7 @@ class BaseDefinition(Base):
         super().__init__(DF)
         self.__var_list: List[str] = []
         self.__value: Dict[str, Base] = {}
+        self.__items: Tuple[Tuple[str, Base], ...] | None = None
 
     def __is_not_defined(self, name: str):
         """
@@ -305,17 +342,12 @@ class BaseDefinition(Base):
 
         :return: A boolean indicating whether the given value is valid based on the current definition.
         """
-        res: bool = True
-        names: List[str] = list(value.keys())
-        i: int = 0
-        while res and i < len(names):
-            if names[i] not in self.__value.keys():
-                res = False
-            else:
-                value_to_check = value[names[i]]
-                res = self.__value[names[i]].check_value(value_to_check)
-            i += 1
-        return res
+        get_definition = self.__value.get
+        for name in value:
+            definition: Base | None = get_definition(name)
+            if definition is None or not definition.check_value(value[name]):
+                return False
+        return True
 
     def get_attributes(self) -> DefAttr:
         """
@@ -338,6 +370,7 @@ class BaseDefinition(Base):
         self.__is_not_defined(name)
         self.__var_list.append(name)
         self.__value[name] = definition
+        self.__items = None
 
     def delete(self, name: str):
         """
@@ -347,6 +380,7 @@ class BaseDefinition(Base):
         """
         self.__var_list.remove(name)
         del self.__value[name]
+        self.__items = None
 
     def get(self, name: str) -> Base:
         """
@@ -388,7 +422,7 @@ class BaseDefinition(Base):
         :return: True if the variable exists, False otherwise.
         :rtype: bool
         """
-        return name in self.__value.keys()
+        return name in self.__value
 
     def variable_list(self) -> List[str]:
         """
@@ -400,6 +434,18 @@ class BaseDefinition(Base):
 
         return self.__var_list
 
+    def variable_items(self) -> Tuple[Tuple[str, Base], ...]:
+        """
+        Get the name and definition of every variable, following the order in which the variables were defined. The
+        tuple is built once and reused until a variable is defined or deleted.
+
+        :return: A tuple of (name, definition) pairs.
+        :rtype: Tuple[Tuple[str, Base], ...]
+        """
+        if self.__items is None:
+            self.__items = tuple((name, self.__value[name]) for name in self.__var_list)
+        return self.__items
+
     def __str__(self):
         """
         Get a string representation of the definition.
@@ -418,21 +464,12 @@ class BaseDefinition(Base):
         :return: A string representation of the definition.
         :rtype: str
         """
-        res: str = ""
-        cnt: int = 1
+        indent: str = "\t" * (level + 1)
+        res: str = "\n".join(
+            indent + k + (": [DEF]\n" + v.to_string(level + 1) if isinstance(v, BaseDefinition) else ": " + str(v))
+            for k, v in self.__value.items())
         if level == 0:
-            res += "[DEF]\n"
-        for k, v in self.__value.items():
-            for _ in range(0, level):
-                res += "\t"
-            res += "\t" + k
-            if isinstance(v, BaseDefinition):
-                res += ": [DEF]\n" + v.to_string(level + 1)
-            else:
-                res += ": " + v.__str__()
-            if cnt != len(self.__value.items()):
-                res += "\n"
-            cnt += 1
+            res = "[DEF]\n" + res
         return res
 
 
@@ -509,22 +546,36 @@ class BaseStructureDefinition(ABC):
 
     def check_value(self, value: Any) -> bool:
         """
-        Check if the value is valid in the definition.
+        Check if the value is valid in the definition. The lists of builtin values and the one-dimensional arrays of an
+        INTEGER or REAL base type are checked at once by means of NumPy.
 
         :param value: The value to check.
         :return: True if the value is valid, otherwise False.
         """
         self.__base_type_defined()
-        res: bool = True
+        base = cast(Base, self.__base)
         if not self.check_length(value):
-            res = False
-        else:
-            i: int = 0
-            while res and i < len(value):
-                value_to_check = value[i]
-                res = cast(Base, self.__base).check_value(value_to_check)
-                i += 1
-        return res
+            return False
+
+        if isinstance(base, (IntegerDefinition, RealDefinition)) and isinstance(value, np.ndarray):
+            if value.ndim != 1 or value.dtype.kind not in ("iu" if isinstance(base, IntegerDefinition) else "f"):
+                return False
+            _, min_value, max_value, _ = base.get_attributes()
+            return len(value) == 0 or _in_range(value, min_value, max_value)
+
+        if isinstance(base, (IntegerDefinition, RealDefinition)) and isinstance(value, list):
+            builtin, dtype = (int, np.int64) if isinstance(base, IntegerDefinition) else (float, np.float64)
+            if set(map(type, value)) == {builtin}:
+                _, min_value, max_value, _ = base.get_attributes()
+                try:
+                    values = np.fromiter(value, dtype=dtype, count=len(value))
+                except OverflowError:
+                    pass
+                else:
+                    return _in_range(values, min_value, max_value)
+
+        check = base.check_value
+        return all(check(value_to_check) for value_to_check in value)
 
     def get_base(self) -> Base:
         """
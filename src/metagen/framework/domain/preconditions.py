@@ -24,42 +24,26 @@ class Primitives:
 
     @staticmethod
     def is_basic_value(value: Any) -> bool:
-        r = False
-        if isinstance(value, (int, float, str)):
-            r = True
-        return r
+        return isinstance(value, (int, float, str))
 
     @staticmethod
     def is_categories_value(value: Any):
-        r = False
-        if isinstance(value, list):
-            if len(value) >= 2:
-                r = all(type(x) == type(y) and Primitives.is_basic_value(x) and x != y
-                        for x, y in pairwise(value))
-        return r
+        return isinstance(value, list) and len(value) >= 2 and \
+            all(type(x) == type(y) and Primitives.is_basic_value(x) and x != y for x, y in pairwise(value))
 
     @staticmethod
     def is_layer_value(value: Any) -> bool:
-        r = False
-        if isinstance(value, dict):
-            r = all(isinstance(k, str) and Primitives.is_basic_value(v)
-                    for k, v in list(value.items()))
-        return r
+        return isinstance(value, dict) and \
+            all(isinstance(k, str) and Primitives.is_basic_value(v) for k, v in value.items())
 
     @staticmethod
     def is_basic_vector_sequence_value(value: Any) -> bool:
-        r = False
-        if isinstance(value, list):
-            r = all(type(x) == type(y) and Primitives.is_basic_value(x)
-                    for x, y in pairwise(value))
-        return r
+        return isinstance(value, list) and \
+            all(type(x) == type(y) and Primitives.is_basic_value(x) for x, y in pairwise(value))
 
     @staticmethod
     def is_layer_vector_sequence_value(value: Any) -> bool:
-        r = False
-        if isinstance(value, list):
-            r = all(Primitives.is_layer_value(x) for x in value)
-        return r
+        return isinstance(value, list) and all(Primitives.is_layer_value(x) for x in value)
 
 
 @final
@@ -67,54 +51,44 @@ class Messages:
 
     @staticmethod
     def min_max(min_value: int | float, max_value: int | float, mode: Literal["i", "r", "s"]) -> str:
-        context = Messages.get_context(mode)
-        return context[0] + " The minimum " + context[1] + " of the variable (" + str(min_value) \
-            + ") must be less than the maximum one (" + str(max_value) + ")."
+        prefix, suffix = Messages.get_context(mode)
+        return f"{prefix} The minimum {suffix} of the variable ({min_value}) must be less than the maximum one " \
+               f"({max_value})."
 
     @staticmethod
     def step_zero(mode: Literal["i", "r", "s"]) -> str:
-        context = Messages.get_context(mode)
-        return context[0] + " The  " + context[1] + " must be greater than zero."
+        prefix, suffix = Messages.get_context(mode)
+        return f"{prefix} The  {suffix} must be greater than zero."
 
     @staticmethod
     def step(step: int | float, avg: int | float, mode: Literal["i", "r", "s"]) -> str:
-        context = Messages.get_context(mode)
-        return context[0] + " The step value (" + str(step) \
-            + ") of the variable must be less or equal than (maximum" \
-            + context[1] + " - minimum " + context[1] + ") / 2 (" \
-            + str(avg) + ")."
+        prefix, suffix = Messages.get_context(mode)
+        return f"{prefix} The step value ({step}) of the variable must be less or equal than " \
+               f"(maximum {suffix} - minimum {suffix}) / 2 ({avg})."
 
     NOT_CATEGORIES: Final = "The categories must be a list, have the same type (int, float or str) and can not " \
                             "contain repeated values"
 
     @staticmethod
     def definition(name: str, mode: Literal["i", "r", "s", "d_a", "d_n", "d_g", "d_s"]):
-        context = Messages.get_context(mode)
-        return context[0] + " The variable " + name + " is " + context[1] + "."
+        prefix, suffix = Messages.get_context(mode)
+        return f"{prefix} The variable {name} is {suffix}."
 
     BASE_TYPE_NOT_DEFINED: Final = "[STRUCTURE definition error] The Base Type is not defined yet."
 
+    CONTEXTS: Final = {
+        "i": ("[INTEGER definition error]", "value"),
+        "r": ("[REAL definition error]", "value"),
+        "s": ("[STRUCTURE definition error]", "length"),
+        "d_a": ("[DEFINITION error]", "already defined"),
+        "d_n": ("[DEFINITION error]", "not defined"),
+        "d_g": ("[DEFINITION error]", "not a group"),
+        "d_s": ("[DEFINITION error]", "not a structure")
+    }
+
     @staticmethod
     def get_context(mode: Literal["i", "r", "s", "d_a", "d_n", "d_g", "d_s"]) -> Tuple[str, str]:
-        prefix: str = "[STRUCTURE definition error]"
-        suffix: str = "length"
-        if mode == "i":
-            prefix = "[INTEGER definition error]"
-            suffix = "value"
-        elif mode == "r":
-            prefix = "[REAL definition error]"
-            suffix = "value"
-        elif mode == ("d_a", "d_g"):
-            prefix = "[DEFINITION error]"
-            if mode == "d_a":
-                suffix = "already defined"
-            elif mode == "d_n":
-                suffix = "not defined"
-            elif mode == "d_g":
-                suffix = "not a group"
-            elif mode == "d_s":
-                suffix = "not a structure"
-        return prefix, suffix
+        return Messages.CONTEXTS.get(mode, Messages.CONTEXTS["s"])
 
 
 @final
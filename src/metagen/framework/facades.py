@@ -15,7 +15,7 @@
     along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 from copy import deepcopy
-from typing import cast
+from typing import Any, Dict, List, Tuple, cast
 
 from metagen.framework import BaseConnector
 from metagen.framework.domain import (Base, BaseDefinition,
@@ -42,13 +42,15 @@ def _check_base_type(core: BaseDefinition, var: str, remember: bool = False) ->
         raise ValueError(Messages.definition(var, "d_n"))
     return cast(Base, res)
 
-def _get_group_definition(name: str, variable: Base) -> BaseDefinition:
+def _get_group_definition(core: BaseDefinition, name: str) -> BaseDefinition:
+    variable: Base = core.get(name)
     if not isinstance(variable, BaseDefinition):
         raise ValueError(Messages.definition(name, "d_g"))
     return cast(BaseDefinition, variable)
 
 
-def _get_structure_definition(name: str, variable: Base) -> BaseStructureDefinition:
+def _get_structure_definition(core: BaseDefinition, name: str) -> BaseStructureDefinition:
+    variable: Base = core.get(name)
     if not isinstance(variable, BaseStructureDefinition):
         raise ValueError(Messages.definition(name, "d_s"))
     return cast(BaseStructureDefinition, variable)
@@ -56,6 +58,8 @@ def _get_structure_definition(name: str, variable: Base) -> BaseStructureDefinit
 
 class Domain:
 
+    __slots__ = ("_connector", "_core")
+
     def __init__(self, connector: BaseConnector = BaseConnector()):
         """
         This class encompasses the domain of the problem by defining a set of variables and its possible values.
@@ -73,10 +77,20 @@ class Domain:
             >>> new_domain.link_variable_to_group("Group", "RealValue")
         """
         self._connector = connector
-        base_definition: type[BaseDefinitionClass] = self._connector.get_definition(
-            self._connector.get_type(dict))
+        base_definition: type[BaseDefinitionClass] = self._get_definition_class(dict)
         self._core: BaseDefinition = base_definition()
 
+    def _get_definition_class(self, builtin: type, structure: str | None = None) -> type:
+        """ It returns the definition class registered in the connector for a builtin type.
+
+        :param builtin: The builtin type.
+        :param structure: The kind of structure ('static' or 'dynamic') when the builtin type is a list.
+        :type builtin: type
+        :type structure: str
+        """
+        type_class = self._connector.get_type(builtin)
+        return self._connector.get_definition((type_class, structure) if structure is not None else type_class)
+
     def define_integer(self, name: str, min_value: int, max_value: int, step: int | None = None):
         """ It defines an **INTEGER** variable receiving a name as its identifier, the minimum and maximum values that it will
         be able to have, and the step size to traverse the interval.
@@ -90,8 +104,7 @@ class Domain:
         :type max_value: int
         :type step: int
         """
-        integer_definition: type[IntegerDefinitionClass] = self._connector.get_definition(
-            self._connector.get_type(int))
+        integer_definition: type[IntegerDefinitionClass] = self._get_definition_class(int)
         self._core.define(name, integer_definition(min_value, max_value, step))
 
     def define_real(self, name: str, min_value: float, max_value: float, step: float | None = None):
@@ -107,8 +120,7 @@ class Domain:
         :type max_value: float
         :type step: float
         """
-        real_definition: type[RealDefinitionClass] = self._connector.get_definition(
-            self._connector.get_type(float))
+        real_definition: type[RealDefinitionClass] = self._get_definition_class(float)
         self._core.define(name, real_definition(min_value, max_value, step))
 
     def define_categorical(self, name: str, categories: CatVal):
@@ -120,8 +132,7 @@ class Domain:
         :type name: str
         :type categories: list of int, float or str
         """
-        categorical_definition: type[CategoricalDefinitionClass] = self._connector.get_definition(
-            self._connector.get_type(str))
+        categorical_definition: type[CategoricalDefinitionClass] = self._get_definition_class(str)
         self._core.define(name, categorical_definition(categories))
 
     def define_group(self, name: str):
@@ -130,8 +141,7 @@ class Domain:
         :param name: The group name.
         :type name: str
         """
-        base_definition: type[BaseDefinitionClass] = self._connector.get_definition(
-            self._connector.get_type(dict))
+        base_definition: type[BaseDefinitionClass] = self._get_definition_class(dict)
 
         self._core.define(name, base_definition())
 
@@ -151,10 +161,8 @@ class Domain:
         :type max_value: int
         :type step: int
         """
-        group_def: BaseDefinition = _get_group_definition(
-            group, self._core.get(group))
-        integer_definition: type[IntegerDefinitionClass] = self._connector.get_definition(
-            self._connector.get_type(int))
+        group_def: BaseDefinition = _get_group_definition(self._core, group)
+        integer_definition: type[IntegerDefinitionClass] = self._get_definition_class(int)
         group_def.define(name, integer_definition(min_value, max_value, step))
 
     def define_real_in_group(self, group: str, name: str, min_value: float, max_value: float,
@@ -173,10 +181,8 @@ class Domain:
         :type max_value: float
         :type step: float
         """
-        group_def: BaseDefinition = _get_group_definition(
-            group, self._core.get(group))
-        real_definition: type[RealDefinitionClass] = self._connector.get_definition(
-            self._connector.get_type(float))
+        group_def: BaseDefinition = _get_group_definition(self._core, group)
+        real_definition: type[RealDefinitionClass] = self._get_definition_class(float)
         group_def.define(name, real_definition(min_value, max_value, step))
 
     def define_categorical_in_group(self, group: str, name: str, categories: CatVal):
@@ -190,10 +196,8 @@ class Domain:
         :type name: str
         :type categories: list of int, float or str
         """
-        group_def: BaseDefinition = _get_group_definition(
-            group, self._core.get(group))
-        categorical_definition: type[CategoricalDefinitionClass] = self._connector.get_definition(
-            self._connector.get_type(str))
+        group_def: BaseDefinition = _get_group_definition(self._core, group)
+        categorical_definition: type[CategoricalDefinitionClass] = self._get_definition_class(str)
         group_def.define(name, categorical_definition(categories))
 
     def link_variable_to_group(self, group: str, var: str, remember: bool = False):
@@ -205,8 +209,7 @@ class Domain:
         :type group: str
         :type remember: bool
         """
-        group_def: BaseDefinition = _get_group_definition(
-            group, self._core.get(group))
+        group_def: BaseDefinition = _get_group_definition(self._core, group)
         base_type: Base = _check_base_type(self._core, var, remember)
         group_def.define(var, base_type)
 
@@ -227,8 +230,7 @@ class Domain:
         :type step_len: int
         """
         base_type: Base | None = _get_base_type(self._core, var, remember)
-        dynamic_structure_definition: type[DynamicStructureDefinitionClass] = self._connector.get_definition(
-            (self._connector.get_type(list), 'dynamic'))
+        dynamic_structure_definition: type[DynamicStructureDefinitionClass] = self._get_definition_class(list, 'dynamic')
         self._core.define(name, dynamic_structure_definition(
             name, base_type, min_len, max_len, step_len))
 
@@ -243,8 +245,7 @@ class Domain:
         :type length: int
         """
         base_type: Base | None = _get_base_type(self._core, var, remember)
-        static_structure_definition: type[StaticStructureDefinitionClass] = self._connector.get_definition(
-            (self._connector.get_type(list), 'static'))
+        static_structure_definition: type[StaticStructureDefinitionClass] = self._get_definition_class(list, 'static')
         self._core.define(name, static_structure_definition(
             name, base_type, length))
 
@@ -261,10 +262,8 @@ class Domain:
         :type max_value: int
         :type step: int
         """
-        structure: BaseStructureDefinition = _get_structure_definition(
-            name, self._core.get(name))
-        integer_definition: type[IntegerDefinitionClass] = self._connector.get_definition(
-            self._connector.get_type(int))
+        structure: BaseStructureDefinition = _get_structure_definition(self._core, name)
+        integer_definition: type[IntegerDefinitionClass] = self._get_definition_class(int)
         structure.set_base(integer_definition(min_value, max_value, step))
 
     def set_structure_to_categorical(self, name: str, categories: CatVal):
@@ -276,10 +275,8 @@ class Domain:
         :type name: str
         :type categories: list of int, float or str
         """
-        structure: BaseStructureDefinition = _get_structure_definition(
-            name, self._core.get(name))
-        categorical_definition: type[CategoricalDefinitionClass] = self._connector.get_definition(
-            self._connector.get_type(str))
+        structure: BaseStructureDefinition = _get_structure_definition(self._core, name)
+        categorical_definition: type[CategoricalDefinitionClass] = self._get_definition_class(str)
         structure.set_base(categorical_definition(categories))
 
     def set_structure_to_real(self, name: str, min_value: float, max_value: float,
@@ -296,10 +293,8 @@ class Domain:
         :type max_value: float
         :type step: float
         """
-        structure: BaseStructureDefinition = _get_structure_definition(
-            name, self._core.get(name))
-        real_definition: type[RealDefinitionClass] = self._connector.get_definition(
-            self._connector.get_type(float))
+        structure: BaseStructureDefinition = _get_structure_definition(self._core, name)
+        real_definition: type[RealDefinitionClass] = self._get_definition_class(float)
         structure.set_base(real_definition(min_value, max_value, step))
 
     def set_structure_to_variable(self, name: str, var: str, remember: bool = False):
@@ -309,11 +304,43 @@ class Domain:
         :type name: str
         :type var: str
         """
-        structure: BaseStructureDefinition = _get_structure_definition(
-            name, self._core.get(name))
+        structure: BaseStructureDefinition = _get_structure_definition(self._core, name)
         base_type: Base = _check_base_type(self._core, var, remember)
         structure.set_base(base_type)
 
+    def define_many(self, specifications: List[Tuple[Any, ...]]):
+        """ It defines several variables at once, following the order of the specifications. Each specification is a
+        tuple with the kind of definition followed by the arguments of its method, where the kind is the name of a
+        ``define_*`` or ``set_structure_to_*`` method without its prefix, or ``"link_variable_to_group"``. For instance,
+        ``("integer", "I", 0, 100)`` calls :meth:`define_integer` and ``("structure_to_real", "S", 0.0, 1.0)`` calls
+        :meth:`set_structure_to_real`.
+        All the kinds are checked before defining any variable, so an unknown kind does not leave the domain half defined.
+
+        **Example:**
+
+        .. code-block:: python
+
+            >>> new_domain = Domain()
+            >>> new_domain.define_many([("integer", "I", 0, 100),
+            ...                         ("static_structure", "S", 10),
+            ...                         ("structure_to_real", "S", 0.0, 1.0)])
+
+        :param specifications: The kind and the arguments of each definition.
+        :type specifications: list of tuple
+        :raises ValueError: If the kind of a specification is not known.
+        """
+        methods = []
+        for kind, *arguments in specifications:
+            name = _DEFINE_METHODS.get(kind)
+            if name is None:
+                raise ValueError(
+                    f"The kind of definition {kind} is not known. One of {list(_DEFINE_METHODS)} was expected.")
+            # The methods are looked up in the instance, so the overrides of a subclass are used
+            methods.append((getattr(self, name), arguments))
+
+        for method, arguments in methods:
+            method(*arguments)
+
     def get_core(self) -> BaseDefinition:
         """ It returns the core which contains the all the defined variables.
         """
@@ -332,3 +359,22 @@ class Domain:
 
     def __repr__(self) -> str:
         return self.get_core().to_string(0)
+
+
+# The name of the method of Domain called for each kind of definition of Domain.define_many.
+_DEFINE_METHODS: Dict[str, str] = {
+    "integer": "define_integer",
+    "real": "define_real",
+    "categorical": "define_categorical",
+    "group": "define_group",
+    "integer_in_group": "define_integer_in_group",
+    "real_in_group": "define_real_in_group",
+    "categorical_in_group": "define_categorical_in_group",
+    "link_variable_to_group": "link_variable_to_group",
+    "dynamic_structure": "define_dynamic_structure",
+    "static_structure": "define_static_structure",
+    "structure_to_integer": "set_structure_to_integer",
+    "structure_to_real": "set_structure_to_real",
+    "structure_to_categorical": "set_structure_to_categorical",
+    "structure_to_variable": "set_structure_to_variable"
+}
@@ -15,6 +15,7 @@
     along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 from .base_solution import Solution
+from .population import Population
 from .types import BaseType, Categorical, Integer, Real, Structure
 
-__all__ = ["Solution", "Structure", "Categorical", "Integer", "Real", "BaseType"]
+__all__ = ["Solution", "Population", "Structure", "Categorical", "Integer", "Real", "BaseType"]
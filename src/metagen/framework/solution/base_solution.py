@@ -19,9 +19,13 @@ from __future__ import annotations
 import random
 import sys
 from collections.abc import Callable
-from typing import TYPE_CHECKING, KeysView, ValuesView, Dict, Any
+from copy import copy
+from typing import TYPE_CHECKING, KeysView, ValuesView, Dict, Any, Final, List, Tuple
+
+import numpy as np
 
 import metagen.framework.solution as types
+from metagen.framework.domain import IntegerDefinition, RealDefinition, StaticStructureDefinition
 
 if TYPE_CHECKING:
     from metagen.framework import BaseConnector, Domain
@@ -29,9 +33,18 @@ if TYPE_CHECKING:
     from metagen.framework.solution.literals import (InputValue, SolLayer)
     from metagen.framework.solution.bounds import BaseTypeClass, SolutionClass
 
+_BEST_FITNESS: Final = sys.float_info.min
+_WORST_FITNESS: Final = sys.float_info.max
+
 
 class Solution:
 
+    __slots__ = ("connector", "__definition", "value", "fitness", "__types", "__types_items", "discovery_iteration")
+
+    # The name of the method of set that stores each class of value, it is shared by all the solutions. The names are
+    # looked up in each solution, so the overrides of a subclass are used.
+    __setters: Dict[type, str] = {}
+
     def __init__(self, definition: Domain | BaseDefinition, best=False, connector=None):
         """ 
         It is the default and unique, constructor builds an empty solution with the worst fitness value
@@ -73,9 +86,11 @@ class Solution:
         self.connector = connector or definition.get_connector()
         self.__definition: BaseDefinition = definition.get_core(
         ) if definition.__class__.__name__ == 'Domain' else definition
+        self.__types: Dict[Tuple[str, type], Tuple[Base, type[BaseTypeClass]]] = {}
+        self.__types_items: Tuple[Tuple[str, Base], ...] | None = None
 
         self.value: Dict[str, types.BaseType] = {}
-        self.fitness: float = sys.float_info.min if best else sys.float_info.max
+        self.fitness: float = _BEST_FITNESS if best else _WORST_FITNESS
 
         self.initialize()
 
@@ -109,28 +124,50 @@ class Solution:
             This method sets the value of a variable in the solution. The type of the value determines how the variable is stored internally. If the value is an integer, it is stored as an integer variable. If it is a float, it is stored as a real variable. If it is a string, it is stored as a categorical variable. If it is a list, it is stored as a vector variable. If it is a dictionary, it is stored as a sub-solution variable. If it is any other type, it must be a pre-defined type for compatibility with previously defined solutions.
 
         .. seealso::
+            :func:`_set_builtin`
             :func:`_set_sub_solution`
             :func:`_set_value`
         """
 
-        if isinstance(value, (int, float, str, list)):
-            base_type_class: type[BaseTypeClass] = self.get_connector().get_type(
-                value)
-            variable_definition: Base = self.get_definition().get(variable)
+        setter = Solution.__setters.get(value.__class__)
+        if setter is None:
+            setter = Solution._resolve_setter(value.__class__)
+            Solution.__setters[value.__class__] = setter
+        getattr(self, setter)(variable, value)
 
-            variable_definition.check_value(value)
+    def set_values(self, values: Dict[str, InputValue | types.BaseType]) -> None:
+        """
+        Sets the values of several variables in the solution at once, which is equivalent to calling :meth:`set` for
+        each of them but resolves the storing method of each value class in a single pass.
 
-            type_value: types.BaseType = base_type_class(
-                variable_definition, self.get_connector())
-            type_value.set(value)
-            self._set_value(variable, type_value)
-        elif isinstance(value, dict):
-            self._set_sub_solution(variable, value)
-        elif types.BaseType:  # Compatibility with already defined types
-            self._set_value(variable, value)
-        else:
-            raise TypeError(
-                f"The type {type(value)} is not supported by the solution.")
+        :param values: A dictionary with the name of each variable to set and its value.
+        :type values: Dict[str, InputValue | BaseType]
+        """
+        setters = Solution.__setters
+        for variable, value in values.items():
+            setter = setters.get(value.__class__)
+            if setter is None:
+                setter = Solution._resolve_setter(value.__class__)
+                setters[value.__class__] = setter
+            getattr(self, setter)(variable, value)
+
+    @staticmethod
+    def _resolve_setter(value_class: type) -> str:
+        """
+        Get the name of the method of the solution that stores a value of the given class. It is used by :meth:`set`
+        when the class is not memoized yet.
+
+        :param value_class: The class of the value.
+        :type value_class: type
+        :return: The name of the method that stores the value.
+        :rtype: str
+        """
+        if issubclass(value_class, (int, float, str, list)):
+            return "_set_builtin"
+        elif issubclass(value_class, dict):
+            return "_set_sub_solution"
+        else:  # Compatibility with already defined types
+            return "_set_value"
 
     def get(self, variable: str) -> types.BaseType:
         """
@@ -225,6 +262,104 @@ class Solution:
         """
         return self.get_variables().values()
 
+    def snapshot(self) -> Solution:
+        """
+        Get a copy of the solution which shares the definition and the connector with the original one. Only the
+        variable values and the fitness are copied, therefore, it is a lightweight alternative to `copy.deepcopy`.
+
+        :return: A copy of the solution.
+        :rtype: Solution
+        """
+        solution = copy(self)
+        solution.value = {k: v.snapshot() for k, v in self.value.items()}
+        return solution
+
+    def copy_from(self, other: Solution) -> None:
+        """
+        Copy the variable values and the fitness of another solution with the same definition into this one in place,
+        reusing the already allocated variables.
+
+        :param other: The solution to copy.
+        :type other: Solution
+        """
+        for variable, other_value in other.value.items():
+            value = self.value.get(variable)
+            if value is None:
+                self.value[variable] = other_value.snapshot()
+            else:
+                value.copy_from(other_value)
+        self.fitness = other.fitness
+
+    def to_vector(self, out: np.ndarray | None = None) -> np.ndarray:
+        """
+        Get the values of the numerical variables of the solution as a vector, following the order in which the
+        variables were defined in the domain. The INTEGER and REAL variables take one position each and the static
+        structures of INTEGER or REAL values take one consecutive position per component, as the columns of
+        :py:meth:`~metagen.framework.solution.Population.to_matrix`. :meth:`from_vector` reads the same layout, so it is
+        the inverse of this method.
+
+        :param out: A preallocated one-dimensional array where the values are written, for instance, a row of a matrix. If not provided, a new array is built.
+        :type out: np.ndarray, optional
+        :return: A one-dimensional array with the values of the solution.
+        :rtype: np.ndarray
+        :raises ValueError: If the solution contains a variable that is not INTEGER, REAL or a static structure of them.
+        """
+        # The numerical types are looked up in the module once instead of once per variable
+        numerical_types = (types.Integer, types.Real)
+        solution_values = self.value
+        values = []
+        for variable, definition in self.get_definition().variable_items():
+            value = solution_values[variable]
+            if isinstance(value, numerical_types):
+                values.append(value.value)
+            elif isinstance(definition, StaticStructureDefinition) and \
+                    isinstance(definition.get_base(), (IntegerDefinition, RealDefinition)):
+                values.extend([component.value for component in value.value])
+            else:
+                raise ValueError(
+                    f"The variable {variable} is not numerical and can not be represented as a vector.")
+        if out is None:
+            return np.array(values, dtype=np.float64)
+        out[:] = values
+        return out
+
+    def from_vector(self, vector: np.ndarray) -> None:
+        """
+        Set the values of the numerical variables of the solution from a vector, following the order in which the
+        variables were defined in the domain and the same layout as :meth:`to_vector`, where each component of a static
+        structure takes its own position. The values are written in place into the current variables of the solution
+        in a single pass, instead of building a new variable for each value.
+
+        :param vector: A one-dimensional array with the values to set.
+        :type vector: np.ndarray
+        :raises ValueError: If the vector length does not match the positions of the variables, a variable is not INTEGER, REAL or a static structure of them, or a value is not valid.
+        """
+        items = self.get_definition().variable_items()
+        length = sum(definition.get_attributes()[1] if isinstance(definition, StaticStructureDefinition) else 1
+                     for _, definition in items)
+        if len(vector) != length:
+            raise ValueError(
+                f"The vector length ({len(vector)}) does not match the number of positions of the variables ({length}).")
+        connector = self.get_connector()
+        solution_values = self.value
+        column = 0
+        for variable, definition in items:
+            current = solution_values[variable]
+            if not isinstance(definition, StaticStructureDefinition):
+                current.set(connector.get_builtin(current)(vector[column]))
+                column += 1
+                continue
+
+            base = definition.get_base()
+            if not isinstance(base, (IntegerDefinition, RealDefinition)):
+                raise ValueError(
+                    f"The variable {variable} is not numerical and can not be set from a vector.")
+            builtin = int if isinstance(base, IntegerDefinition) else float
+            components = current.value
+            for component, value in zip(components, vector[column:column + len(components)].tolist()):
+                component.set(builtin(value))
+            column += len(components)
+
     def initialize(self):
         """
         Initializes the solution with random values defined in its domain.
@@ -237,9 +372,7 @@ class Solution:
             :func:`get_definition`
             :func:`set`
         """
-        domain: BaseDefinition = self.get_definition()
-        for variable in domain.variable_list():
-            definition = domain.get(variable)
+        for variable, definition in self.get_definition().variable_items():
             self._initialize(variable, definition)
 
     def mutate(self, alterations_number: int = None, alteration_limit: Any = None):
@@ -253,17 +386,15 @@ class Solution:
             :func:`get_variables`
             :func:`initialize`
         """
-        variables = self.get_variables().keys()
+        variables = list(self.get_variables())
         alterations_number = alterations_number or random.randint(
             1, len(variables))
-        altered_variables = set(random.sample(
-            list(variables), alterations_number))
+        altered_variables = set(random.sample(variables, alterations_number))
 
+        # The values are mutated in place, so they are not stored again
+        values = self.value
         for variable in altered_variables:
-            value = self.get(variable)
-            value.mutate(alteration_limit=alteration_limit)
-
-            self.set(variable, value)
+            values[variable].mutate(alteration_limit=alteration_limit)
 
     # ** PRIVATE FUNCTIONS ***
 
@@ -284,6 +415,23 @@ class Solution:
         self.value[key] = value
 
     # ** LAYER TYPE METHODS ***
+    def _set_builtin(self, variable: str, value: InputValue):
+        """
+        Sets the value of a variable from a builtin value, which is converted into the type of the variable.
+
+        :param variable: The name of the variable to set.
+        :type variable: str
+        :param value: The builtin value.
+        :type value: InputValue
+        """
+        variable_definition, base_type_class = self._resolve_type(variable, value)
+
+        # The value is checked by the set method of its type
+        type_value: types.BaseType = base_type_class(
+            variable_definition, self.get_connector())
+        type_value.set(value)
+        self._set_value(variable, type_value)
+
     def _set_sub_solution(self, variable: str, value: SolLayer):
         """
         Sets the value of a sub-solution variable.
@@ -302,14 +450,11 @@ class Solution:
         """
         variable_definition = self.get_definition().get(variable)
 
-        solution_definition: type[SolutionClass] = self.get_connector().get_type(
-            value)
-        subsolution: Solution = solution_definition(
-            variable_definition, connector=self.get_connector())
+        connector = self.get_connector()
+        solution_definition: type[SolutionClass] = connector.get_type(value)
+        subsolution: Solution = solution_definition(variable_definition, connector=connector)
         subsolution.value = {}
-
-        for k, v in value.items():
-            subsolution.set(k, v)
+        subsolution.set_values(value)
 
         self._set_value(variable, subsolution)
 
@@ -330,26 +475,43 @@ class Solution:
             :meth:`initialize`
             :meth:`set`
         """
-        type_class: type[BaseTypeClass] = self.get_connector().get_type(
-            definition)
-        variable_definition = self.get_definition().get(variable)
-        self.set(variable, type_class(
-            variable_definition, connector=self.get_connector()))
+        connector = self.get_connector()
+        type_class: type[BaseTypeClass] = connector.get_type(definition)
+        self.set(variable, type_class(definition, connector=connector))
+
+    def _resolve_type(self, variable: str, value: InputValue) -> Tuple[Base, type[BaseTypeClass]]:
+        """
+        Get the definition of a variable and the type used to store a builtin value in it. The pair is memoized by the
+        name of the variable and the class of the value, and the memo is discarded when a variable of the definition is
+        defined or deleted.
+
+        :param variable: The name of the variable.
+        :type variable: str
+        :param value: The builtin value to store.
+        :type value: InputValue
+        :return: The definition of the variable and the type of the value.
+        :rtype: Tuple[Base, type[BaseTypeClass]]
+        """
+        items = self.__definition.variable_items()
+        if items is not self.__types_items:
+            self.__types = {}
+            self.__types_items = items
+
+        key = (variable, value.__class__)
+        resolved = self.__types.get(key)
+        if resolved is None:
+            resolved = (self.__definition.get(variable), self.get_connector().get_type(value))
+            self.__types[key] = resolved
+        return resolved
 
     # ** SET VALUE METHOD
 
     def __str__(self):
         """ String representation of a :py:class:`~metagen.individual.Individual` object.
         """
-        res = "F = " + str(self.fitness) + "\t{"
-        count = 1
-        for variable in sorted(self.value):
-            res += str(variable) + " = " + str(self.value[variable])
-            if count < len(self.get_variables()):
-                res += " , "
-            count += 1
-        res += "}"
-        return res
+        values = self.value
+        body = " , ".join(f"{variable} = {values[variable]}" for variable in sorted(values))
+        return f"F = {self.fitness}\t{{{body}}}"
 
     def __repr__(self):
         return str(self)
@@ -384,27 +546,27 @@ class Solution:
         """
         return iter(self.get_variables())
 
+    def __contains__(self, variable):
+        """
+        Checks if a variable is available in the solution by means of a direct lookup in its value dict, instead of
+        iterating over the variable names.
+        :return: True if the variable is available, False otherwise.
+        :rtype: bool
+        """
+        return variable in self.value
+
     def __eq__(self, other):
         """ Equity function of the :py:class:`~metagen.framework.Solution` class. An
         :py:class:`~metagen.individual.Individual` object is equal to another :py:class:`~metagen.framework.Solution`
         object if they have the same variables with the same values.
         """
-        res = True
-
         if not isinstance(other, Solution):
-            res = False
-        else:
-            i = 0
-            if self.get_variables().keys() != other.get_variables().keys():
-                res = False
-            else:
-                keys = list(self.get_variables().keys())
-                while i < len(keys) and res:
-                    vf = self.get(keys[i])
-                    vo = other.get(keys[i])
-                    res = vf == vo
-                    i += 1
-        return res
+            return False
+
+        values, other_values = self.value, other.value
+        if values.keys() != other_values.keys():
+            return False
+        return all(value == other_values[variable] for variable, value in values.items())
 
     def __ne__(self, other):
         """ Non Equity function of the :py:class:`~metagen.individual.Individual` class. An
@@ -415,9 +577,12 @@ class Solution:
 
     def __hash__(self):
         """ Hash function for :py:class:`~metagen.individual.Individual` objects. It is necessary for set structure
-        management.
+        management. It is consistent with :meth:`__eq__`: the values of the variables are hashed in the order in which
+        they were defined, and the fitness is not considered. As the hash of a string depends on the `PYTHONHASHSEED` of
+        each process, the hash of a solution with CATEGORICAL values is not stable across processes.
         """
-        return hash((self.get_variables().__hash__, self.fitness))
+        values = self.value
+        return hash(tuple(values.get(variable) for variable in self.__definition.variable_list()))
 
     def __lt__(self, other):
         """ *Less than* function for :py:class:`~metagen.individual.Individual` objects. An individual **A** is less
@@ -446,3 +611,18 @@ class Solution:
         fitness value of **B**. It is necessary for set structure management.
         """
         return self.fitness >= other.fitness
+
+    @staticmethod
+    def sort_population(population: List[SolutionClass]) -> List[SolutionClass]:
+        """
+        Sort a list of solutions by their fitness, from the best to the worst. The fitness values are gathered in an
+        array which is sorted at once by NumPy, instead of comparing the solutions by pairs. The sort is stable, so
+        solutions with the same fitness keep their relative order, as with :func:`sorted`.
+
+        :param population: The solutions to sort.
+        :type population: List[Solution]
+        :return: A new list with the sorted solutions.
+        :rtype: List[Solution]
+        """
+        fitness = np.fromiter((solution.fitness for solution in population), dtype=np.float64, count=len(population))
+        return [population[i] for i in np.argsort(fitness, kind="stable").tolist()]
@@ -14,7 +14,7 @@
     You should have received a copy of the GNU General Public License
     along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
-from typing import Any
+from typing import Any, Dict
 
 from .base_solution import Solution
 from .types.base import BaseType
@@ -51,6 +51,8 @@ class DevSolution(Solution):
         F = 1.7976931348623157e+308     {example = 1}
     """
 
+    __slots__ = ()
+
     def check(self, variable, value=None):
         """Check if a variable is defined in the domain and if the value is valid.
 
@@ -61,13 +63,15 @@ class DevSolution(Solution):
         :raises ValueError: If the variable is not available in the solution or not defined in the domain or the assigned value is not valid.
         """
 
-        if not self.get_definition().is_variable(variable):
+        try:
+            definition = self.get_definition().get(variable)
+        except KeyError:
             raise ValueError(
-                f"The variable {variable} does not exists in the Domain.")
+                f"The variable {variable} does not exists in the Domain.") from None
 
-        if not isinstance(value, BaseType) and value is not None and not self.get_definition().get(variable).check_value(value):
+        if value is not None and not isinstance(value, BaseType) and not definition.check_value(value):
             raise ValueError(
-                f"The value {value} assigned to the variable {variable} is not valid. {self.get_definition().get(variable)}")
+                f"The value {value} assigned to the variable {variable} is not valid. {definition}")
 
     def get(self, variable: str) -> Any:
         """
@@ -87,9 +91,12 @@ class DevSolution(Solution):
             :func:`_get_value`
             :func:`set`
         """
-        self.check(variable)
-
-        return super().get(variable)
+        try:
+            return super().get(variable)
+        except KeyError:
+            # The variable is only checked when it is missing, to raise the proper error
+            self.check(variable)
+            raise
 
     def set(self, variable: str, value: Any):
         """
@@ -115,3 +122,16 @@ class DevSolution(Solution):
         self.check(variable, value)
 
         return super().set(variable, value)
+
+    def set_values(self, values: Dict[str, Any]) -> None:
+        """
+        Sets the values of several variables in the solution at once, after checking each of them.
+
+        :param values: A dictionary with the name of each variable to set and its value.
+        :type values: Dict[str, Any]
+        :raises ValueError: If a variable is not defined in the definition or its value does not meets the definition conditions.
+        """
+        for variable, value in values.items():
+            self.check(variable, value)
+
+        super().set_values(values)
@@ -24,8 +24,8 @@ VECTOR: Final = "VECTOR"
 SEQUENCE: Final = "SEQUENCE"
 BASIC: Final = "BASIC"
 NUMERICAL: Final = "NUMERICAL"
-BASICS: Final = ("INTEGER", "REAL", "CATEGORICAL")
-NUMERICALS: Final = ("INTEGER", "REAL")
+BASICS: Final = frozenset({"INTEGER", "REAL", "CATEGORICAL"})
+NUMERICALS: Final = frozenset({"INTEGER", "REAL"})
 INTEGER_TYPE = Literal["INTEGER"]
 REAL_TYPE = Literal["REAL"]
 CATEGORICAL_TYPE = Literal["CATEGORICAL"]
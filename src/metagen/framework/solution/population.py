@@ -0,0 +1,307 @@
+"""
+    Copyright (C) 2023 David Gutierrez Avilés and Manuel Jesús Jiménez Navarro
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+from __future__ import annotations
+
+import sys
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, cast
+
+import numpy as np
+
+from metagen.framework.domain import (CategoricalDefinition, IntegerDefinition, RealDefinition,
+                                      StaticStructureDefinition)
+
+from .base_solution import Solution
+from .types import BaseType, Structure
+
+if TYPE_CHECKING:
+    from metagen.framework import Domain
+
+
+def _generate_integer(definition: IntegerDefinition, current: np.ndarray, initialize: bool) -> np.ndarray:
+    """
+    Generate a random value for each individual of an INTEGER variable, considering the step size.
+    """
+    _, min_value, max_value, step = definition.get_attributes()
+    step = step or 1
+    return min_value + step * np.random.randint(0, (max_value - min_value) // step + 1, size=current.shape)
+
+
+def _generate_real(definition: RealDefinition, current: np.ndarray, initialize: bool) -> np.ndarray:
+    """
+    Generate a random value for each individual of a REAL variable, considering the step size.
+    """
+    _, min_value, max_value, step = definition.get_attributes()
+    values = np.random.uniform(min_value, max_value, size=current.shape)
+    if step is not None:
+        values = np.clip(np.round(values / step) * step, min_value, max_value)
+    return values
+
+
+def _generate_categorical(definition: CategoricalDefinition, current: np.ndarray, initialize: bool) -> np.ndarray:
+    """
+    Generate a random category index for each individual of a CATEGORICAL variable. When not initializing, the current
+    category of each individual is excluded, as :py:meth:`~metagen.framework.solution.Categorical.mutate` does.
+    """
+    categories = len(definition.get_attributes()[1])
+    if initialize:
+        return np.random.randint(0, categories, size=current.shape)
+    if categories < 2:
+        return np.zeros(current.shape, dtype=np.int64)
+    values = np.random.randint(0, categories - 1, size=current.shape)
+    return values + (values >= current)
+
+
+_GENERATORS: Dict[type, Callable[[Any, np.ndarray, bool], np.ndarray]] = {
+    IntegerDefinition: _generate_integer,
+    RealDefinition: _generate_real,
+    CategoricalDefinition: _generate_categorical
+}
+
+
+class Population:
+    """
+    A population of solutions of a flat domain (only INTEGER, REAL and CATEGORICAL variables, and static structures of
+    them) stored as a structure of arrays: one array per variable, where each row corresponds to an individual, and a
+    fitness array. The population is mutated, crossed and compared as a whole, and a :py:class:`~metagen.framework.Solution` is
+    only built when one of its individuals is requested.
+
+    The INTEGER and REAL variables are stored as the columns of a single column-major matrix of floats, so the
+    population of a numerical domain is already laid out as a matrix. A static structure of INTEGER or REAL values is
+    stored as a block of consecutive columns of the same matrix, one per component, so its array has two dimensions.
+    The CATEGORICAL variables are stored as the index of the category of each individual, in the order in which the
+    categories were defined.
+
+    :param domain: The domain of the individuals.
+    :type domain: Domain
+    :param size: The number of individuals.
+    :type size: int
+    :raises ValueError: If the domain contains a variable that is not INTEGER, REAL, CATEGORICAL or a static structure of them.
+
+    **Code example**
+
+    .. code-block:: python
+
+        from metagen.framework import Domain
+        from metagen.framework.solution import Population
+
+        domain = Domain()
+        domain.define_integer("x", 0, 10)
+        domain.define_categorical("c", ["A", "B", "C"])
+
+        population = Population(domain, 50)
+        population.mutate()
+        population.fitness[:] = population.vars["x"] ** 2
+        best = population.solution(population.best())
+    """
+
+    def __init__(self, domain: Domain, size: int) -> None:
+        core = domain.get_core()
+
+        self._domain = domain
+        # The connector and the solution type are resolved once from the domain, instead of once per built solution
+        self._connector = domain.get_connector()
+        self._solution_type: type[Solution] = self._connector.get_type(core)
+        self._size = size
+        self._variables: List[str] = [variable for variable, _ in core.variable_items()]
+        self._definitions: List[Any] = []
+        self._lengths: List[int | None] = []  # The length of each structure, None for the other variables
+        self._generators: List[Callable[[Any, np.ndarray, bool], np.ndarray]] = []
+        self._decoders: List[Callable[[Any], Any]] = []
+        self._encoders: List[Callable[[Any], int] | None] = []  # The category index of each value, None for numbers
+        self._categorical: str | None = None
+
+        for variable, definition in core.variable_items():
+            length = None
+            if isinstance(definition, StaticStructureDefinition):
+                length, definition = definition.get_attributes()[1], definition.get_base()
+            if type(definition) not in _GENERATORS:
+                raise ValueError(
+                    f"The variable {variable} is not INTEGER, REAL, CATEGORICAL or a static structure of them and can not be stored in a population.")
+            self._definitions.append(definition)
+            self._lengths.append(length)
+        numerical = sum(length or 1 for definition, length in zip(self._definitions, self._lengths)
+                        if type(definition) is not CategoricalDefinition)
+        self._matrix: np.ndarray = np.zeros((size, numerical), dtype=np.float64, order="F")
+
+        self.vars: Dict[str, np.ndarray] = {}
+        column = 0
+        for variable, definition, length in zip(self._variables, self._definitions, self._lengths):
+            definition_class = type(definition)
+            self._generators.append(_GENERATORS[definition_class])
+            if definition_class is CategoricalDefinition:
+                self.vars[variable] = np.zeros(size if length is None else (size, length), dtype=np.int64)
+                categories = definition.get_attributes()[1]
+                self._decoders.append(categories.__getitem__)
+                self._encoders.append({category: i for i, category in enumerate(categories)}.__getitem__)
+                self._categorical = self._categorical or variable
+            elif length is None:
+                self.vars[variable] = self._matrix[:, column]
+                column += 1
+                self._decoders.append(int if definition_class is IntegerDefinition else float)
+                self._encoders.append(None)
+            else:
+                self.vars[variable] = self._matrix[:, column:column + length]
+                column += length
+                self._decoders.append(int if definition_class is IntegerDefinition else float)
+                self._encoders.append(None)
+        self.fitness: np.ndarray = np.full(size, sys.float_info.max, dtype=np.float64)
+
+        self.mutate(alter_all=True)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def mutate(self, alter_all: bool = False) -> None:
+        """
+        Mutate every individual following the same scheme as :py:meth:`~metagen.framework.Solution.mutate`: a random
+        number of variables of each individual is replaced by a random value within its definition. When a structure is
+        mutated, a random number of its components is replaced, as :py:meth:`~metagen.framework.solution.Structure.mutate`
+        does for static structures.
+
+        :param alter_all: If True, all the variables are replaced, which is used to initialize the population.
+        :type alter_all: bool, optional
+        """
+        n, d = self._size, len(self._variables)
+        if d == 0:
+            return
+
+        if alter_all:
+            altered = np.ones((n, d), dtype=bool)
+        else:
+            alterations = np.random.randint(1, d + 1, size=(n, 1))
+            altered = np.argsort(np.random.random((n, d)), axis=1) < alterations
+
+        for j, (variable, definition, generate) in enumerate(zip(self._variables, self._definitions, self._generators)):
+            column = self.vars[variable]
+            where = altered[:, j]
+            if column.ndim == 2:
+                where = where[:, np.newaxis]
+                length = column.shape[1]
+                if not alter_all and length > 0:
+                    changes = np.random.randint(1, length + 1, size=(n, 1))
+                    where = where & (np.argsort(np.random.random((n, length)), axis=1) < changes)
+            np.copyto(column, generate(definition, column, alter_all), where=where)
+
+    def crossover(self, first: np.ndarray, second: np.ndarray) -> None:
+        """
+        Replace every individual by a child of two individuals of the population, following a uniform crossover: each
+        value of the child, including each component of a structure, is taken at random from one of its parents. As
+        the numerical values of an individual are a row of the matrix, the children of all the individuals are built
+        at once by means of :func:`numpy.where`. The fitness of the children is reset, since they are not evaluated.
+
+        :param first: The index of the first parent of each individual.
+        :type first: np.ndarray
+        :param second: The index of the second parent of each individual.
+        :type second: np.ndarray
+        """
+        # The parents are gathered before writing any child, as an individual can be the parent of another one
+        matrix = self._matrix
+        matrix[:] = np.where(np.random.random(matrix.shape) < 0.5, matrix[first], matrix[second])
+
+        for variable, encode in zip(self._variables, self._encoders):
+            if encode is not None:
+                column = self.vars[variable]
+                column[:] = np.where(np.random.random(column.shape) < 0.5, column[first], column[second])
+
+        self.fitness[:] = sys.float_info.max
+
+    def best(self) -> int:
+        """
+        Get the index of the individual with the lowest fitness.
+        """
+        return int(self.fitness.argmin())
+
+    def unique(self) -> np.ndarray:
+        """
+        Get the index of the first individual of each group of equal individuals, that is, of the individuals that
+        build equal solutions regardless of their fitness. All the individuals are compared at once by means of NumPy,
+        instead of comparing pairs of solutions.
+
+        :return: The sorted indexes of the distinct individuals.
+        :rtype: np.ndarray
+        """
+        columns = [self._matrix] + [self.vars[variable].reshape(self._size, -1).astype(np.float64)
+                                    for variable, encode in zip(self._variables, self._encoders) if encode is not None]
+        _, indexes = np.unique(np.hstack(columns), axis=0, return_index=True)
+        return np.sort(indexes)
+
+    def to_matrix(self) -> np.ndarray:
+        """
+        Get the population as a matrix with one individual per row and one variable per column, following the order in
+        which the variables were defined in the domain. The components of a structure take consecutive columns. The matrix is not copied: it shares its memory with the variable
+        arrays, therefore, it must not be modified.
+
+        :return: A two-dimensional array with the values of the individuals.
+        :rtype: np.ndarray
+        :raises ValueError: If the domain contains a CATEGORICAL variable.
+        """
+        if self._categorical is not None:
+            raise ValueError(
+                f"The variable {self._categorical} is not numerical and can not be represented as a vector.")
+        return self._matrix
+
+    def solution(self, index: int, solution: Solution | None = None) -> Solution:
+        """
+        Build a solution from an individual of the population, including its fitness.
+
+        :param index: The index of the individual.
+        :type index: int
+        :param solution: A solution of the same domain whose values are overwritten in place. If not provided, a new one is built.
+        :type solution: Solution, optional
+        :return: The solution of the individual.
+        :rtype: Solution
+        """
+        if solution is None:
+            solution = self._solution_type(self._domain, connector=self._connector)
+
+        # The values are trusted, so they are written in place into the variables of the solution
+        values = solution.get_variables()
+        for variable, decode, length in zip(self._variables, self._decoders, self._lengths):
+            if length is None:
+                BaseType.set(values[variable], decode(self.vars[variable][index]))
+            else:
+                structure = cast(Structure, values[variable])
+                for component, value in zip(structure.value, self.vars[variable][index].tolist()):
+                    BaseType.set(component, decode(value))
+        solution.set_fitness(float(self.fitness[index]))
+
+        return solution
+
+    def put(self, index: int, solution: Solution) -> None:
+        """
+        Store a solution of the same domain as an individual of the population, including its fitness. It is the
+        inverse of :meth:`solution`: the numerical values are gathered in a row which is written into the matrix at once.
+
+        :param index: The index of the individual.
+        :type index: int
+        :param solution: The solution to store.
+        :type solution: Solution
+        """
+        row: List[float] = []
+        values = solution.get_variables()
+        for variable, encode, length in zip(self._variables, self._encoders, self._lengths):
+            value = values[variable].value
+            if length is not None:
+                value = [component.value for component in value]
+            if encode is not None:
+                self.vars[variable][index] = encode(value) if length is None else [encode(v) for v in value]
+            elif length is None:
+                row.append(value)
+            else:
+                row.extend(value)
+        self._matrix[index] = row
+        self.fitness[index] = solution.get_fitness()
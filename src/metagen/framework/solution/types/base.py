@@ -18,6 +18,7 @@ from __future__ import annotations
 
 import random
 from abc import ABC, abstractmethod
+from copy import copy
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -28,6 +29,8 @@ if TYPE_CHECKING:
 
 class BaseType(ABC):
 
+    __slots__ = ("__definition", "value", "connector")
+
     def __init__(self, definition: Base, connector: BaseConnector = None) -> None:
         """
         This class represents an abstraction of the types included in a Solution. Note that the class support a Domain or a Base definition and the type is initialized in the constructor.
@@ -86,6 +89,19 @@ class BaseType(ABC):
 
         self.value = value
 
+    def snapshot(self) -> BaseType:
+        """
+        Returns a copy of the variable which shares the definition and the connector with the original one. It is a
+        lightweight alternative to `copy.deepcopy` to preserve the current value.
+        """
+        return copy(self)
+
+    def copy_from(self, other: BaseType) -> None:
+        """
+        Copies the value of another variable with the same definition into this one in place.
+        """
+        self.value = other.value
+
     def __str__(self):
         """
         Returns a string representation of the value of the variable.
@@ -24,6 +24,8 @@ from .base import BaseType
 
 class Categorical(BaseType):
 
+    __slots__ = ()
+
     def __init__(self, definition: CategoricalDefinition, connector=None) -> None:
         """
         The Categorical class inherits from the BaseType class and represents a categorical variable.
@@ -55,7 +57,7 @@ class Categorical(BaseType):
         _, categories = self.get_definition().get_attributes()
         random_category = random.choice(categories)
 
-        self.set(random_category)
+        super().set(random_category)  # The value is valid by construction
 
     def mutate(self, alteration_limit: Any = None) -> None:
         """
@@ -65,7 +67,7 @@ class Categorical(BaseType):
         current_category = self.get()
         random_category = random.choice(
             [category for category in categories if category != current_category])
-        self.set(random_category)
+        super().set(random_category)  # The value is valid by construction
 
     def set(self, value: Any) -> None:
         """
@@ -24,6 +24,8 @@ from .base import BaseType
 
 class Integer(BaseType):
 
+    __slots__ = ()
+
     def __init__(self, definition: IntegerDefinition, connector=None) -> None:
         """
         The Integer class inherits from the BaseType class and represents an integer variable.
@@ -57,7 +59,7 @@ class Integer(BaseType):
         _, min_value, max_value, step = self.get_definition().get_attributes()
         step = step or 1
         random_integer = random.randrange(min_value, max_value + 1, step)
-        self.set(random_integer)
+        super().set(random_integer)  # The value is valid by construction
 
     def mutate(self, alteration_limit: int=None) -> None:
         """
@@ -77,7 +79,7 @@ class Integer(BaseType):
             
 
         random_integer = random.randrange(min_value, max_value + 1, step)
-        self.set(random_integer)
+        super().set(random_integer)  # The value is valid by construction
 
     def set(self, value: Any) -> None:
         """
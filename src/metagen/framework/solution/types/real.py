@@ -24,6 +24,8 @@ from .base import BaseType
 
 class Real(BaseType):
 
+    __slots__ = ()
+
     def __init__(self, definition: RealDefinition, connector=None) -> None:
         """
         The Real class inherits from the BaseType class and represents a Real variable.
@@ -73,7 +75,7 @@ class Real(BaseType):
             min_value = limited_min_value if max_value > limited_min_value > min_value else min_value
             max_value = limited_max_value if max_value > limited_max_value > min_value else max_value
 
-        self.set(self._generate_numerical(min_value, max_value, step))
+        super().set(self._generate_numerical(min_value, max_value, step))  # The value is valid by construction
 
     def set(self, value: Any) -> None:
         """
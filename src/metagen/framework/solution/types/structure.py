@@ -15,10 +15,14 @@
     along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 import random
+from copy import copy
 from typing import Any, cast, TYPE_CHECKING
 
-from metagen.framework.domain.core import (BaseStructureDefinition,
+import numpy as np
+
+from metagen.framework.domain.core import (BaseDefinition, BaseStructureDefinition,
                                            DynamicStructureDefinition,
+                                           IntegerDefinition, RealDefinition,
                                            StaticStructureDefinition)
 from metagen.framework.solution.literals import InputValue, SolVector
 from metagen.framework.solution import Solution
@@ -26,11 +30,14 @@ from metagen.framework.solution import Solution
 from .base import BaseType
 
 if TYPE_CHECKING:
+    from metagen.framework.domain import Base
     from metagen.framework.solution.bounds import BaseTypeClass
 
 
 class Structure(BaseType):
 
+    __slots__ = ()
+
     def __init__(self, definition: BaseStructureDefinition, connector=None):
         """
         The Real class inherits from the BaseType class and represents a Real variable.
@@ -62,10 +69,7 @@ class Structure(BaseType):
         :type index: int
         :rtype: bool
         """
-        r = False
-        if 0 <= index < len(cast(SolVector, super().value)):
-            r = True
-        return r
+        return 0 <= index < len(cast(SolVector, self.value))
 
     def initialize(self) -> None:
         """
@@ -77,24 +81,23 @@ class Structure(BaseType):
             :meth:`get_definition`
         """
 
-        self.set([])
-
         size = 0
+        definition = self.get_definition()
 
-        if isinstance(self.get_definition(), DynamicStructureDefinition):
-            _, min_size, max_size, step_size, _ = self.get_definition().get_attributes()
+        if isinstance(definition, DynamicStructureDefinition):
+            _, min_size, max_size, step_size, _ = definition.get_attributes()
 
             size = random.randrange(min_size, max_size, step_size or 1)
 
-        elif isinstance(self.get_definition(), StaticStructureDefinition):
-            _, size, _ = self.get_definition().get_attributes()
+        elif isinstance(definition, StaticStructureDefinition):
+            _, size, _ = definition.get_attributes()
 
-        for _ in range(size):
-            base_type_class = self.get_connector().get_type(self.get_definition().get_base())
+        base = definition.get_base()
+        connector = self.get_connector()
+        base_type_class = connector.get_type(base)
 
-            base_value: BaseType = base_type_class(
-                self.get_definition().get_base(), connector=self.get_connector())
-            self.append(base_value)
+        # The values are built from the base definition, so they are stored without checking and converting them
+        self.value = [base_type_class(base, connector=connector) for _ in range(size)]
 
     def mutate(self, alteration_limit: Any = None) -> None:
         """
@@ -131,9 +134,97 @@ class Structure(BaseType):
         """
 
         if index is not None:
-            return super().get()[index]
+            return self.value[index]
         else:
-            return super().get()
+            return self.value
+
+    def to_numpy(self) -> np.ndarray:
+        """
+        Obtains the builtin values of a Structure of INTEGER or REAL values as a contiguous array, with an `int64` or
+        `float64` data type respectively, so they can be processed in a vectorized way. The array is a copy, therefore,
+        modifying it does not alter the Structure; use :meth:`set` or :meth:`apply_mutations` to store it back.
+
+        :return: A one-dimensional array with the values of the Structure.
+        :rtype: np.ndarray
+        :raises ValueError: If the values of the Structure are not INTEGER or REAL.
+        """
+        return np.fromiter((v.value for v in self.value), dtype=self._numerical_dtype(), count=len(self.value))
+
+    def apply_mutations(self, indices: np.ndarray, values: np.ndarray) -> int:
+        """
+        Sets the values of several positions of a Structure of INTEGER or REAL values at once. The new values are
+        checked against the range and the step of the base definition in a vectorized way, and the invalid ones are
+        skipped. The non-integral values of an INTEGER Structure are invalid, instead of being truncated.
+
+        :param indices: The positions to modify.
+        :type indices: np.ndarray
+        :param values: The new value of each position.
+        :type values: np.ndarray
+        :return: The number of positions that have been modified.
+        :rtype: int
+        :raises ValueError: If the values of the Structure are not INTEGER or REAL or the new values are not numbers.
+        :raises IndexError: If a position is not an integer within the length of the Structure.
+        """
+        dtype = self._numerical_dtype()
+        _, min_value, max_value, step = self.get_definition().get_base().get_attributes()
+        structure_values = self.value
+
+        indices = np.asarray(indices)
+        if indices.size > 0 and (indices.dtype.kind not in "iu" or indices.min() < 0
+                                 or indices.max() >= len(structure_values)):
+            raise IndexError(
+                f"The positions {indices} are not valid for a structure of length {len(structure_values)}.")
+        values = np.asarray(values)
+        if values.size > 0 and values.dtype.kind not in "iuf":
+            raise ValueError(f"The values {values} are not numbers.")
+
+        valid = (values >= min_value) & (values <= max_value)
+        if dtype is np.int64:
+            if values.dtype.kind == "f":
+                valid &= values == np.trunc(values)
+            if step is not None:
+                valid &= (values - min_value) % step == 0
+        elif step is not None:
+            steps = (values - min_value) / step
+            valid &= np.isclose(steps, np.round(steps))
+
+        for index, value in zip(indices[valid].tolist(), values[valid].astype(dtype).tolist()):
+            BaseType.set(structure_values[index], value)
+        return int(np.count_nonzero(valid))
+
+    def _numerical_dtype(self) -> type:
+        """
+        Get the NumPy data type of the values of a Structure of INTEGER or REAL values.
+
+        :raises ValueError: If the values of the Structure are not INTEGER or REAL.
+        """
+        base = self.get_definition().get_base()
+        if isinstance(base, IntegerDefinition):
+            return np.int64
+        elif isinstance(base, RealDefinition):
+            return np.float64
+        raise ValueError(
+            f"The values of the structure {self.get_definition()} are not numerical and can not be represented as an array.")
+
+    def snapshot(self) -> BaseType:
+        """
+        Returns a copy of the Structure which shares the definition and the connector with the original one, copying
+        each of its values by means of their `snapshot` method.
+        """
+        structure = copy(self)
+        structure.value = [v.snapshot() for v in self.value]
+        return structure
+
+    def copy_from(self, other: BaseType) -> None:
+        """
+        Copies the values of another Structure with the same definition into this one in place. When both Structures
+        have the same length, the values are reused; otherwise, they are replaced by snapshots of the other values.
+        """
+        if len(self.value) == len(other.value):
+            for value, other_value in zip(self.value, other.value):
+                value.copy_from(other_value)
+        else:
+            self.value = [v.snapshot() for v in other.value]
 
     def _resize(self) -> None:
         """
@@ -147,22 +238,24 @@ class Structure(BaseType):
         new_size = round(self._generate_numerical(
             min_size, max_size, step_size))
 
+        values = self.value
         if new_size > current_size:
             n_deletions = 0
-            base_type_class = self.get_connector().get_type(self.get_definition().get_base())
+            base = self.get_definition().get_base()
+            connector = self.get_connector()
+            base_type_class = connector.get_type(base)
+            append = values.append
             for _ in range(new_size - current_size):
-                new_value: BaseType = base_type_class(
-                    self.get_definition().get_base(), connector=self.get_connector())
+                new_value: BaseType = base_type_class(base, connector=connector)
                 new_value.initialize()
-                self.append(new_value)
+                append(new_value)
         elif current_size > new_size:
             n_deletions = current_size - new_size
         else:
             n_deletions = 0
 
         for _ in range(n_deletions):
-            ri = random.choice(range(len(self)))
-            del self[ri]
+            del values[random.choice(range(len(values)))]
 
     def _alterate(self, alteration_limit: Any=None) -> None:
         """
@@ -171,11 +264,11 @@ class Structure(BaseType):
 
         current_size = len(self)
         number_of_changes = random.randint(1, current_size)
-        index_to_change = random.sample(
-            list(range(0, current_size)), number_of_changes)
+        index_to_change = random.sample(range(current_size), number_of_changes)
 
+        values = self.value
         for i in index_to_change:
-            self.get(i).mutate(alteration_limit=alteration_limit)
+            values[i].mutate(alteration_limit=alteration_limit)
 
     def _convert(self, value: InputValue) -> BaseType:
         """
@@ -195,10 +288,15 @@ class Structure(BaseType):
         :raises ValueError: If the type of the input value is not supported by the Structure [int, float, str, list, dict, BaseType]. 
         """
         if isinstance(value, int | float | str | list | dict):
-            base_type_class: type[BaseType] = self.get_connector().get_type(
-                value)
-            value = base_type_class(self.get_definition(
-            ).get_base(), connector=self.get_connector())
+            connector = self.get_connector()
+            base_type_class: type[BaseType] = connector.get_type(value)
+            builtin_value = value
+            value = base_type_class(self.get_definition().get_base(), connector=connector)
+            if isinstance(builtin_value, dict):
+                # The value of a group is a sub-solution, whose variables are set by name
+                value.set_values(builtin_value)
+            else:
+                value.set(builtin_value)
         elif BaseType:  # Compatibility with already defined types
             pass
         else:
@@ -248,10 +346,7 @@ class Structure(BaseType):
         :return: None
         """
         self.check(value)
-
-        current_values = self.get()
-        current_values[index] = self._convert(value)
-        self.set(current_values)
+        self.value[index] = self._convert(value)
 
     def insert(self, index: int, value: int | float | str | list | dict | BaseType) -> None:
         """
@@ -264,9 +359,7 @@ class Structure(BaseType):
         :return: None
         """
         self.check(value)
-        current_values = self.get()
-        current_values[index].insert(index, self._convert(value))
-        self.set(current_values)
+        self.value.insert(index, self._convert(value))
 
     def append(self, value: int | float | str | list | dict | BaseType) -> None:
         """
@@ -277,26 +370,53 @@ class Structure(BaseType):
         :return: None
         """
         self.check(value)
-        current_values = self.get()
-        current_values.append(self._convert(value))
-        self.set(current_values)
+        self.value.append(self._convert(value))
 
-    def set(self, value: list[BaseType | Any]) -> None:
+    def set(self, value: list[BaseType | Any] | np.ndarray) -> None:
 
-        base_type_class: type[BaseTypeClass] = self.get_connector().get_type(
-            self.get_definition())
+        # An array is checked at once, so its values are set without checking them again
+        checked = isinstance(value, np.ndarray)
+        if checked:
+            if not self.get_definition().check_value(value):
+                raise ValueError(
+                    f"The value {value} provided is not valid for definition: {self.get_definition()}")
+            value = value.tolist()
+        else:
+            # The list of the caller is copied, so it is neither modified by the conversion nor shared with the structure
+            value = list(value)
+
+        connector = self.get_connector()
+        base: Base = self.get_definition().get_base()
+        base_type_class: type[BaseTypeClass] = connector.get_type(base)
 
         # Transform the values inside the list if they are a builtin
-        for index in range(len(value)):
-            v = value[index]
+        for index, v in enumerate(value):
             if not isinstance(v, (BaseType, Solution)):
-                type_value: BaseType | Solution = base_type_class(
-                    self.get_definition().get_base(), self.get_connector())
-                type_value.set(v)
+                type_value: BaseType | Solution = base_type_class(base, connector=connector)
+                if checked:
+                    BaseType.set(type_value, v)
+                elif isinstance(v, dict):
+                    # The value of a group is a sub-solution, whose variables are set by name
+                    type_value.set_values(v)
+                else:
+                    type_value.set(v)
                 value[index] = type_value
 
         self.value = value
 
+    def __hash__(self) -> int:
+        """
+        Returns the hash of the values of the Structure, which are hashed in order. The builtin values of the
+        components are hashed directly, without calling the hash method of each component, unless the components are
+        solutions of a group.
+
+        :return: The hash of the Structure.
+        :rtype: int
+        """
+        if isinstance(self.get_definition().get_base(), BaseDefinition):
+            return hash(tuple(self.value))
+        return hash(tuple([component.value for component in self.value]))
+
     def __str__(self) -> str:
         """
         Returns a string representation of the Structure.
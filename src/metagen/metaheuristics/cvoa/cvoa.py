@@ -14,7 +14,6 @@
     You should have received a copy of the GNU General Public License
     along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
-import copy
 import logging
 import math
 import random
@@ -121,6 +120,7 @@ class CVOA:
     # If true, the isolated set is updated.
     __update_isolated: bool | None = None
     # If true show log messages.
+    __verbose: bool = False
     __verbosity: Callable[[str], None] | None = None
 
     def __init__(self, strain_id="Strain 1", pandemic_duration=10, spreading_rate=5, min_super_spreading_rate=6,
@@ -229,6 +229,7 @@ class CVOA:
         :param verbose: The verbosity option
         :type verbose: bool
         """
+        CVOA.__verbose = verbose
         CVOA.__verbosity = \
             print if verbose else lambda *a, **k: None 
 
@@ -261,8 +262,7 @@ class CVOA:
         # ***** STEP 1. PATIENT ZERO (PZ) GENERATION. *****
 
         pz = self.__infect_pz()
-        CVOA.__verbosity(
-            "\nPatient Zero (" + self.__strainID + "): \n" + str(pz))
+        CVOA.__verbosity(f"\nPatient Zero ({self.__strainID}): \n{pz}")
 
         # Initialize strain:
         # Add the patient zero to the strain-specific infected set.
@@ -298,16 +298,13 @@ class CVOA:
             # Stop if no new infected individuals.
             if not self.__infectedStrain:
                 epidemic = False
-                CVOA.__verbosity(
-                    "No new infected individuals in " + self.__strainID)
+                CVOA.__verbosity(f"No new infected individuals in {self.__strainID}")
 
             # Update the elapsed pandemic time.
             self.__time += 1
 
-        CVOA.__verbosity("\n\n" + self.__strainID +
-                         " converged after " + str(self.__time) + " iterations.")
-        CVOA.__verbosity("Best individual: " +
-                         str(self.__bestStrainIndividual))
+        CVOA.__verbosity(f"\n\n{self.__strainID} converged after {self.__time} iterations.")
+        CVOA.__verbosity(f"Best individual: {self.__bestStrainIndividual}")
 
         # When the CVOA algorithm finishes, returns the best individual found for the specific strain.
         # If a mult-strain experiment is performed, the global best individual
@@ -375,14 +372,14 @@ class CVOA:
                         if CVOA.__update_isolated:
                             self.__update_isolated_population(individual)
 
-        # Just one print to ensure it is printed without interfering with other threads
-        CVOA.__verbosity("\n" + str(threading.current_thread()) +
-                         "\n[" + self.__strainID + "] - Iteration #" + str(self.__time + 1) +
-                         "\n\tBest global individual: " +
-                         str(CVOA.__bestIndividual)
-                         + "\n\tBest strain individual: " +
-                         str(self.__bestStrainIndividual)
-                         + "\n" + self.__r0_report(len(new_infected_population)))
+        # Just one print to ensure it is printed without interfering with other threads. The report is only built
+        # when it is going to be shown.
+        if CVOA.__verbose:
+            CVOA.__verbosity(f"\n{threading.current_thread()}"
+                             f"\n[{self.__strainID}] - Iteration #{self.__time + 1}"
+                             f"\n\tBest global individual: {CVOA.__bestIndividual}"
+                             f"\n\tBest strain individual: {self.__bestStrainIndividual}"
+                             f"\n{self.__r0_report(len(new_infected_population))}")
         # + "\n\tR0 = " + str(len(new_infected_population) / len(self.__infectedStrain)))
 
         # Update the infected strain population for the next iteration
@@ -413,10 +410,7 @@ class CVOA:
         r0 = new_infections
         if recovered != 0:
             r0 = new_infections / recovered
-        report = "\tNew infected = " + \
-            str(new_infections) + ", Recovered = " + \
-            str(recovered) + ", R0 = " + str(r0)
-        return report
+        return f"\tNew infected = {new_infections}, Recovered = {recovered}, R0 = {r0}"
 
     @staticmethod
     def __infect(individual, travel_distance):
@@ -425,7 +419,7 @@ class CVOA:
         :returns: The newly infected individual.
         :rtype: :py:class:`~metagen.framework.Solution`
         """
-        infected = copy.deepcopy(individual)
+        infected = individual.snapshot()
 
         infected.mutate(travel_distance)
 
@@ -469,8 +463,7 @@ class CVOA:
                     CVOA.__bestIndividual = individual
                     print(CVOA.__bestIndividual)
                     CVOA.__lock.release()
-                    CVOA.__verbosity(
-                        "\nNew best Individual found by " + self.__strainID + "!")
+                    CVOA.__verbosity(f"\nNew best Individual found by {self.__strainID}!")
 
                 # If the current individual is better than the current strain one, a new strain the best individual is
                 # found, and its variable is updated.
@@ -569,11 +562,11 @@ class CVOA:
             # This action adds more diversification to the metaheuristic.
             elif ty == 'd':
                 if to_insert < self.__bestDeadIndividualStrain:
-                    logging.debug("bag: %s", str(bag))
-                    logging.debug("__bestDeadIndividualStrain: %s",
-                                  str(self.__bestDeadIndividualStrain))
-                    logging.debug("contains?: %s", str(
-                        self.__bestDeadIndividualStrain in bag))
+                    # The membership test hashes every value of the individual, so it only runs when debugging
+                    if logging.getLogger().isEnabledFor(logging.DEBUG):
+                        logging.debug("bag: %s", bag)
+                        logging.debug("__bestDeadIndividualStrain: %s", self.__bestDeadIndividualStrain)
+                        logging.debug("contains?: %s", self.__bestDeadIndividualStrain in bag)
 
                     bag.remove(self.__bestDeadIndividualStrain)
                     bag.add(to_insert)
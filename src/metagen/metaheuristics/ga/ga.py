@@ -64,12 +64,13 @@ class GA:
         Initialize the population of solutions by creating and evaluating initial solutions.
         """
         self.population = []
-        solution_type: type[GASolution] = self.domain.get_connector().get_type(
+        connector = self.domain.get_connector()
+        solution_type: type[GASolution] = connector.get_type(
             self.domain.get_core())
 
         for _ in range(self.population_size):
             solution = solution_type(
-                self.domain, connector=self.domain.get_connector())
+                self.domain, connector=connector)
             solution.evaluate(self.fitness_func)
             self.population.append(solution)
 
@@ -81,7 +82,7 @@ class GA:
         :rtype: List[Solution]
         """
 
-        parents = sorted(self.population, key=lambda sol: sol.fitness)[:2]
+        parents = GASolution.sort_population(self.population)[:2]
         return parents
 
     def run(self) -> GASolution:
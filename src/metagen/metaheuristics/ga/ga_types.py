@@ -17,8 +17,7 @@
 from __future__ import annotations
 
 import random
-from copy import copy
-from typing import Tuple
+from typing import Dict, Final, Tuple
 
 import metagen.framework.solution as types
 from metagen.framework import BaseConnector, Solution
@@ -27,6 +26,8 @@ from metagen.framework.domain import (BaseDefinition, CategoricalDefinition,
                                       IntegerDefinition, RealDefinition,
                                       StaticStructureDefinition)
 
+_BASIC_BUILTINS: Final = frozenset({int, float, str})
+
 
 class GAStructure(types.Structure):
     """
@@ -39,6 +40,8 @@ class GAStructure(types.Structure):
         crossover(other: GAStructure) -> Tuple[GAStructure, GAStructure]: Performs crossover operation with another GAStructure instance.
     """
 
+    __slots__ = ()
+
     def crossover(self, other: GAStructure) -> Tuple[GAStructure, GAStructure]:
         """
          Performs crossover operation with another GAStructure instance by randomly modifying list positions. Note that this operation does not support an `DynamicStructureDefinition`.
@@ -49,17 +52,17 @@ class GAStructure(types.Structure):
 
         current_size = min(len(self), len(other))
         number_of_changes = random.randint(1, current_size)
-        indexes_to_change = random.sample(
-            list(range(0, current_size)), number_of_changes)
+        indexes_to_change = set(random.sample(
+            range(0, current_size), number_of_changes))
 
         if isinstance(self.get_definition(), DynamicStructureDefinition):
             raise NotImplementedError()
         else:
             for i in range(current_size):
                 if i in indexes_to_change:
-                    child1[i], child2[i] = copy(other.get(i)), copy(self.get(i))
+                    child1[i], child2[i] = other.get(i).snapshot(), self.get(i).snapshot()
                 else:
-                    child1[i], child2[i] = copy(self.get(i)), copy(other.get(i))
+                    child1[i], child2[i] = self.get(i).snapshot(), other.get(i).snapshot()
         return child1, child2
 
 
@@ -72,47 +75,58 @@ class GASolution(Solution):
         crossover(other: GASolution) -> Tuple[GASolution, GASolution]: Performs crossover operation with another GASolution instance.
     """
 
+    __slots__ = ()
+
     def crossover(self, other: GASolution) -> Tuple[GASolution, GASolution]:
         """
         Performs crossover operation with another GASolution instance by randomly exchanging variables.
         """
-        assert self.get_variables().keys() == other.get_variables().keys()
+        variables, other_variables = self.get_variables(), other.get_variables()
+        assert variables.keys() == other_variables.keys()
 
         basic_variables = []
+        basic_types: Dict[type, bool] = {}  # Whether the values of each type are basic
+
+        for variable_name, variable_value in variables.items():
 
-        for variable_name, variable_value in self.get_variables().items():
+            value_type = variable_value.__class__
+            basic = basic_types.get(value_type)
+            if basic is None:
+                registered_type = (value_type, "static") if isinstance(variable_value, GAStructure) else value_type
+                basic = self.connector.get_builtin(registered_type) in _BASIC_BUILTINS
+                basic_types[value_type] = basic
 
-            if isinstance(variable_value, GAStructure):
-                variable_value = (variable_value, "static")
-                
-            if self.connector.get_builtin(variable_value) in [int, float, str]:
+            if basic:
                 basic_variables.append(variable_name)
 
         if len(basic_variables) > 0:
             n_variables_to_exchange = random.randint(
                 1, len(basic_variables) - 1)
 
-            variables_to_exchange = random.sample(
-                basic_variables, n_variables_to_exchange)
+            variables_to_exchange = set(random.sample(
+                basic_variables, n_variables_to_exchange))
         else:
-            variables_to_exchange = []
+            variables_to_exchange = set()
+        basic_variable_set = set(basic_variables)
 
-        child1 = GASolution(self.get_definition(), connector=self.connector)
-        child2 = GASolution(self.get_definition(), connector=self.connector)
+        definition = self.get_definition()
+        child1 = GASolution(definition, connector=self.connector)
+        child2 = GASolution(definition, connector=self.connector)
+        set_child1, set_child2 = child1.set, child2.set
 
-        for variable_name, variable_value in self.get_variables().items():  # Iterate over all variables
+        for variable_name, variable_value in variables.items():  # Iterate over all variables
 
-            if variable_name not in basic_variables:
+            if variable_name not in basic_variable_set:
                 variable_child1, variable_child2 = variable_value.crossover(
-                    other.get(variable_name))
-                child1.set(variable_name, copy(variable_child1))
-                child2.set(variable_name, copy(variable_child2))
+                    other_variables[variable_name])
+                set_child1(variable_name, variable_child1)
+                set_child2(variable_name, variable_child2)
             elif variable_name in variables_to_exchange:
-                child1.set(variable_name, copy(other.get(variable_name)))
-                child2.set(variable_name, copy(variable_value))
+                set_child1(variable_name, other_variables[variable_name].snapshot())
+                set_child2(variable_name, variable_value.snapshot())
             else:
-                child1.set(variable_name, copy(self.get(variable_name)))
-                child2.set(variable_name, copy(variable_value))
+                set_child1(variable_name, variable_value.snapshot())
+                set_child2(variable_name, variable_value.snapshot())
 
         return child1, child2
 
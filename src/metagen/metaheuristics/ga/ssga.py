@@ -64,16 +64,17 @@ class SSGA:
         Initialize the population of solutions by creating and evaluating initial solutions.
         """
         self.population = []
-        solution_type: type[GASolution] = self.domain.get_connector().get_type(
+        connector = self.domain.get_connector()
+        solution_type: type[GASolution] = connector.get_type(
             self.domain.get_core())
 
         for _ in range(self.population_size):
             solution = solution_type(
-                self.domain, connector=self.domain.get_connector())
+                self.domain, connector=connector)
             solution.evaluate(self.fitness_func)
             self.population.append(solution)
         
-        self.population = sorted(self.population, key=lambda sol: sol.fitness)
+        self.population = GASolution.sort_population(self.population)
 
 
     def select_parents(self) -> List[GASolution]:
@@ -100,7 +101,7 @@ class SSGA:
         if worst_solution.fitness > child.fitness:
             self.population[-1] = child
         
-        self.population = sorted(self.population, key=lambda sol: sol.fitness)
+        self.population = GASolution.sort_population(self.population)
 
     def run(self) -> GASolution:
         """
@@ -14,10 +14,17 @@
     You should have received a copy of the GNU General Public License
     along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
-from copy import deepcopy
-from typing import Callable, List
+import random
+import sys
+from concurrent.futures import Executor, ProcessPoolExecutor
+from multiprocessing import Value
+from operator import attrgetter
+from typing import Any, Callable, List, Tuple
+
+import numpy as np
 
 from metagen.framework import Domain, Solution
+from metagen.framework.solution import Population
 
 
 class RandomSearch:
@@ -35,6 +42,12 @@ class RandomSearch:
     :type search_space_size: int, optional
     :param iterations: The number of optimization iterations. Default is 20.
     :type iterations: int, optional
+    :param n_jobs: The number of worker processes used to evaluate the solutions of each iteration. If 1, the solutions are evaluated sequentially; if -1, all the available processors are used; 0 raises a ValueError. The processes are created by each call to :meth:`run` and shut down when it returns. Default is 1.
+    :type n_jobs: int, optional
+    :param executor: An already created executor used to evaluate the solutions. If provided, `n_jobs` is ignored and the executor is not shut down by the search. Default is None.
+    :type executor: Executor, optional
+    :param vectorized: If True, the fitness function receives the whole population as a two-dimensional array (one row per solution, see :py:meth:`~metagen.framework.Solution.to_vector`) and must return a one-dimensional array with the fitness of each solution. Both :meth:`run` and :meth:`run_islands` support the same domains: INTEGER and REAL variables, which take one column each, and static structures of them, which take one column per component; any other variable raises a ValueError. Default is False.
+    :type vectorized: bool, optional
 
     **Code example**
 
@@ -52,40 +65,274 @@ class RandomSearch:
         search = RandomSearch(domain, fitness_function, search_space_size=50, iterations=100)
         optimal_solution = search.run()
 
+    Note that when the evaluation is performed in parallel (`n_jobs` different from 1), the fitness function and the
+    solutions are sent to the worker processes, therefore, the fitness function must be picklable (i.e., defined at the
+    top level of a module).
     """
 
     def __init__(self, domain: Domain, fitness: Callable[[Solution], float], search_space_size: int = 30,
-                 iterations: int = 20) -> None:
+                 iterations: int = 20, n_jobs: int = 1, executor: Executor | None = None,
+                 vectorized: bool = False) -> None:
+
+        if n_jobs == 0:
+            raise ValueError(
+                "n_jobs == 0 has no meaning, use 1 to evaluate sequentially or -1 to use all the processors.")
 
         self.domain = domain
         self.fitness = fitness
         self.search_space_size = search_space_size
         self.iterations = iterations
+        self.n_jobs = n_jobs
+        self.executor = executor
+        self.vectorized = vectorized
+
+
+        connector = self.domain.get_connector()
+        solution_type: type[Solution] = connector.get_type(
+            self.domain.get_core())
+        self.best_solution: Solution = solution_type(
+            self.domain, connector=connector)
+
+    def evaluate(self, potential_solutions: List[Solution]) -> None:
+        """
+        Evaluate a list of solutions, sequentially, by means of the executor if it has been defined or in a single
+        call to the fitness function if it is vectorized.
+
+        :param potential_solutions: The solutions to evaluate.
+        :type potential_solutions: List[Solution]
+        """
+
+        if self.vectorized:
+            if not potential_solutions:
+                return
+            # The batch is allocated once with the width of the first vector, as a structure takes several columns,
+            # and each of the other solutions writes its values into its own row
+            first = potential_solutions[0].to_vector()
+            batch = np.empty((len(potential_solutions), len(first)), dtype=np.float64)
+            batch[0] = first
+            for ps, row in zip(potential_solutions[1:], batch[1:]):
+                ps.to_vector(out=row)
+            fitnesses = self.fitness(batch)
+            for ps, fitness in zip(potential_solutions, fitnesses):
+                ps.set_fitness(float(fitness))
+        elif self.executor is None:
+            fitness = self.fitness
+            for ps in potential_solutions:
+                ps.evaluate(fitness)
+        else:
+            fitnesses = self.executor.map(self.fitness, potential_solutions)
+            for ps, fitness in zip(potential_solutions, fitnesses):
+                ps.set_fitness(fitness)
 
     def run(self) -> Solution:
         """
         Run the random search optimization algorithm.
 
-        This method generates and evaluates random solutions in the search space to find an optimal solution.
+        This method generates and evaluates random solutions in the search space to find an optimal solution. The best
+        solution is copied in place into the `best_solution` attribute, which is allocated once and reused by every run,
+        and a snapshot of it is returned, so the result of a run is not overwritten by the next one.
 
         :return: The optimal solution found.
         :rtype: Solution
         """
 
-        potential_solutions: List[Solution] = list()
-        solution_type: type[Solution] = self.domain.get_connector().get_type(
-            self.domain.get_core())
-        
-        for _ in range(0, self.search_space_size):
-            potential_solutions.append(solution_type(
-                self.domain, connector=self.domain.get_connector()))
-        solution: Solution = deepcopy(min(potential_solutions))
+        if self.vectorized:
+            return self._run_population().snapshot()
 
-        for _ in range(0, self.iterations):
+        # A pool of processes is only created for this run and shut down at its end; an executor provided by the
+        # caller is kept open
+        if self.executor is None and self.n_jobs != 1:
+            with ProcessPoolExecutor(max_workers=self.n_jobs if self.n_jobs > 0 else None) as executor:
+                self.executor = executor
+                try:
+                    return self._run_solutions().snapshot()
+                finally:
+                    self.executor = None
+
+        return self._run_solutions().snapshot()
+
+    def _run_solutions(self) -> Solution:
+        """
+        Run the random search over a list of solutions, which are evaluated by means of :meth:`evaluate`.
+
+        :return: The optimal solution found.
+        :rtype: Solution
+        """
+
+        potential_solutions: List[Solution] = self.initialize()
+        self.evaluate(potential_solutions)
+        solution: Solution = self.best_solution
+        solution.copy_from(min(potential_solutions, key=attrgetter("fitness")))
+
+        self._iterate(potential_solutions, solution, self.iterations)
+
+        return solution
+
+    def run_islands(self, n_islands: int, migrations: int = 0) -> Solution:
+        """
+        Run the random search optimization algorithm following an island model, that is, `n_islands` independent
+        searches are run in parallel, each one in its own process. The iterations are split into `migrations` rounds;
+        after each round, the global best solution is sent to every island, replacing its worst solution. If
+        `migrations` is 0, the islands are run independently from the beginning to the end.
+
+        The islands share the best fitness found so far and the index of the island which found it, so only the
+        islands that improve it send their best solution back. The best solution is copied in place into the
+        `best_solution` attribute and a snapshot of it is returned, as in :meth:`run`. Note that the domain, the fitness function and the solutions are sent to the worker
+        processes, therefore, they must be picklable.
+
+        :param n_islands: The number of islands (processes).
+        :type n_islands: int
+        :param migrations: The number of rounds between which the best solution is exchanged. Default is 0.
+        :type migrations: int, optional
+        :return: The optimal solution found among all the islands.
+        :rtype: Solution
+        """
+
+        rounds = max(migrations, 1)
+        populations: List[List[Solution] | None] = [None] * n_islands
+        migrant: Solution | None = None
+        solution: Solution = self.best_solution
+
+        best_fitness = Value("d", sys.float_info.max)
+        best_island = Value("l", -1)
+
+        with ProcessPoolExecutor(max_workers=n_islands, initializer=_initialize_island,
+                                 initargs=(best_fitness, best_island)) as executor:
+            for current_round in range(rounds):
+                iterations = self.iterations // rounds
+                if current_round == 0:
+                    iterations += self.iterations % rounds
+
+                best_island.value = -1
+                futures = [executor.submit(_run_island, island, self.domain, self.fitness, self.search_space_size,
+                                           iterations, self.vectorized, random.randrange(2 ** 32), population,
+                                           migrant)
+                           for island, population in enumerate(populations)]
+                results = [future.result() for future in futures]
+
+                populations = [population for population, _ in results]
+                # Only an improvement is sent in the next round, so the same migrant is never inserted twice
+                migrant = None
+                if best_island.value >= 0:
+                    migrant = results[best_island.value][1]
+                    solution.copy_from(migrant)
+
+        return solution.snapshot()
+
+    def initialize(self) -> List[Solution]:
+        """
+        Build a new population of `search_space_size` random solutions.
+
+        :return: The new population.
+        :rtype: List[Solution]
+        """
+
+        domain = self.domain
+        connector = domain.get_connector()
+        core = domain.get_core()
+        solution_type: type[Solution] = connector.get_type(core)
+
+        return [solution_type(domain, connector=connector) for _ in range(0, self.search_space_size)]
+
+    def _iterate(self, potential_solutions: List[Solution], solution: Solution, iterations: int) -> None:
+        """
+        Perform the given number of iterations of the random search over a population, copying every improvement in
+        place into `solution`.
+
+        :param potential_solutions: The population to mutate and evaluate.
+        :type potential_solutions: List[Solution]
+        :param solution: The best solution found so far.
+        :type solution: Solution
+        :param iterations: The number of iterations to perform.
+        :type iterations: int
+        """
+
+        for _ in range(0, iterations):
             for ps in potential_solutions:
                 ps.mutate()
-                ps.evaluate(self.fitness)
-                if ps < solution:
-                    solution = deepcopy(ps)
+
+            self.evaluate(potential_solutions)
+
+            fitnesses = np.fromiter((ps.fitness for ps in potential_solutions), dtype=np.float64,
+                                    count=self.search_space_size)
+            i = int(fitnesses.argmin())
+            if fitnesses[i] < solution.fitness:
+                solution.copy_from(potential_solutions[i])
+
+    def _run_population(self) -> Solution:
+        """
+        Run the random search over a :py:class:`~metagen.framework.solution.Population`, which is used for vectorized
+        fitness functions. The mutation, evaluation and selection of the best solution are performed for the whole
+        population at once, and only the best individual is built as a solution.
+
+        :return: The optimal solution found.
+        :rtype: Solution
+        :raises ValueError: If the domain contains a non-numerical variable.
+        """
+
+        population = Population(self.domain, self.search_space_size)
+        population.fitness[:] = self.fitness(population.to_matrix())
+        solution = population.solution(population.best(), self.best_solution)
+        best_fitness = solution.fitness
+
+        for _ in range(0, self.iterations):
+            population.mutate()
+            population.fitness[:] = self.fitness(population.to_matrix())
+
+            i = population.best()
+            if population.fitness[i] < best_fitness:
+                best_fitness = float(population.fitness[i])
+                population.solution(i, solution)
 
         return solution
+
+
+_best_fitness: Any = None
+_best_island: Any = None
+
+
+def _initialize_island(best_fitness: Any, best_island: Any) -> None:
+    """
+    Initialize a worker process of :py:meth:`~metagen.metaheuristics.RandomSearch.run_islands`, storing the shared
+    best fitness and best island index.
+    """
+    global _best_fitness, _best_island
+    _best_fitness = best_fitness
+    _best_island = best_island
+
+
+def _run_island(island: int, domain: Domain, fitness: Callable[[Solution], float], search_space_size: int,
+                iterations: int, vectorized: bool, seed: int, potential_solutions: List[Solution] | None,
+                migrant: Solution | None) -> Tuple[List[Solution], Solution | None]:
+    """
+    Run a round of an island of :py:meth:`~metagen.metaheuristics.RandomSearch.run_islands` in a worker process. If no
+    population is provided, a new one is built; otherwise, its worst solution is replaced by the migrant (if any) and
+    the search is resumed. If the best solution of the island improves the shared best fitness, the island is
+    registered as the best one.
+
+    :return: The population of the island and its best solution, or None if it does not improve the shared best.
+    :rtype: Tuple[List[Solution], Solution | None]
+    """
+    random.seed(seed)
+    np.random.seed(seed)
+
+    search = RandomSearch(domain, fitness, search_space_size=search_space_size, iterations=iterations,
+                          vectorized=vectorized)
+    if potential_solutions is None:
+        potential_solutions = search.initialize()
+        search.evaluate(potential_solutions)
+    elif migrant is not None:
+        worst = max(range(len(potential_solutions)), key=lambda i: potential_solutions[i].get_fitness())
+        potential_solutions[worst] = migrant
+
+    solution: Solution = search.best_solution
+    solution.copy_from(min(potential_solutions, key=attrgetter("fitness")))
+    search._iterate(potential_solutions, solution, iterations)
+
+    with _best_fitness.get_lock():
+        if solution.fitness < _best_fitness.value:
+            _best_fitness.value = solution.fitness
+            _best_island.value = island
+            return potential_solutions, solution
+
+    return potential_solutions, None
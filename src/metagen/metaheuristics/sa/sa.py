@@ -16,7 +16,6 @@
 """
 from metagen.framework import Domain, Solution
 from collections.abc import Callable
-from copy import deepcopy
 import random
 import math
 
@@ -88,7 +87,7 @@ class SA:
 
         while current_iteration <= self.n_iterations:
 
-            neighbour = deepcopy(self.solution)
+            neighbour = self.solution.snapshot()
 
             neighbour.mutate(alteration_limit=self.alteration_limit)
 
@@ -19,6 +19,11 @@ import random
 import sys
 from os import path
 
+import numpy as np
+import pytest
+
+from metagen.framework import Domain, Solution
+
 sys.path.append(path.dirname(path.dirname(path.abspath(__file__))))
 
 from utils import domain, solution
@@ -48,3 +53,171 @@ def test_random_solution() -> None:
         # Alterate all variables which is the most expensive computation
         solution_copy.mutate(alterations_number=len(variables))
         assert solution_copy != solution
+
+
+def test_snapshot_solution() -> None:
+    random.seed(123)
+    repetitions = 100
+
+    for _ in range(repetitions):
+        solution_copy = copy.deepcopy(solution)
+        solution_snapshot = solution.snapshot()
+
+        assert solution_snapshot == solution
+        assert solution_snapshot.fitness == solution.fitness
+        solution_snapshot.mutate(alterations_number=len(solution.get_variables()))
+        assert solution_snapshot != solution
+        assert solution_copy == solution
+
+
+def test_copy_from_solution() -> None:
+    random.seed(123)
+    repetitions = 100
+    solution_buffer = solution.snapshot()
+
+    for _ in range(repetitions):
+        solution_copy = copy.deepcopy(solution)
+        solution_copy.mutate(alterations_number=len(solution.get_variables()))
+
+        solution_buffer.copy_from(solution_copy)
+        assert solution_buffer == solution_copy
+        solution_copy.mutate(alterations_number=len(solution.get_variables()))
+        assert solution_buffer != solution_copy
+
+
+def test_structure_builtin_values() -> None:
+    random.seed(123)
+    solution_snapshot = solution.snapshot()
+    structure = solution_snapshot.get("SSI")
+    length = len(structure)
+
+    structure.append(7)
+    structure.insert(0, -3)
+    structure[1] = 5
+
+    assert len(structure) == length + 2
+    assert structure[0] == -3
+    assert structure[1] == 5
+    assert structure[-1] == 7
+
+
+def test_structure_to_numpy() -> None:
+    random.seed(123)
+    solution_snapshot = solution.snapshot()
+    structure = solution_snapshot.get("SSI")
+
+    values = structure.to_numpy()
+
+    assert values.dtype == np.int64
+    assert values.tolist() == [structure[i] for i in range(len(structure))]
+
+    structure.set(np.clip(values + 1, -5, 10))
+
+    assert structure.to_numpy().tolist() == np.clip(values + 1, -5, 10).tolist()
+    assert all(isinstance(structure[i], int) for i in range(len(structure)))
+    assert solution_snapshot.get("SSR").to_numpy().dtype == np.float64
+
+    with pytest.raises(ValueError):
+        solution_snapshot.get("SSC").to_numpy()
+
+    with pytest.raises(ValueError):
+        structure.set(values + 100)
+
+    with pytest.raises(ValueError):
+        structure.set(values.astype(np.float64))
+
+
+def test_structure_apply_mutations() -> None:
+    random.seed(123)
+    solution_snapshot = solution.snapshot()
+    structure = solution_snapshot.get("SSI")
+    values = structure.to_numpy()
+
+    applied = structure.apply_mutations(np.array([0, 1, 2]), np.array([-5, 10, 11]))
+
+    assert applied == 2
+    assert structure[0] == -5 and isinstance(structure[0], int)
+    assert structure[1] == 10
+    assert structure[2] == values[2]
+
+    applied = structure.apply_mutations(np.array([3, 4]), np.array([3.7, 4.0]))
+
+    assert applied == 1
+    assert structure[3] == values[3]
+    assert structure[4] == 4 and isinstance(structure[4], int)
+
+    with pytest.raises(IndexError):
+        structure.apply_mutations(np.array([-1]), np.array([0]))
+
+    with pytest.raises(IndexError):
+        structure.apply_mutations(np.array([len(structure)]), np.array([0]))
+
+
+def test_structure_apply_mutations_step() -> None:
+    random.seed(123)
+    step_domain = Domain()
+    step_domain.define_static_structure("SI", 3)
+    step_domain.set_structure_to_integer("SI", 0, 10, 2)
+    step_domain.define_static_structure("SR", 3)
+    step_domain.set_structure_to_real("SR", 0.0, 1.0, 0.25)
+    step_solution = Solution(step_domain)
+    integer_structure, real_structure = step_solution.get("SI"), step_solution.get("SR")
+    integer_values, real_values = integer_structure.to_numpy(), real_structure.to_numpy()
+
+    assert integer_structure.apply_mutations(np.array([0, 1]), np.array([4, 5])) == 1
+    assert integer_structure[0] == 4
+    assert integer_structure[1] == integer_values[1]
+
+    assert real_structure.apply_mutations(np.array([0, 1, 2]), np.array([0.75, 0.3, np.nan])) == 1
+    assert real_structure[0] == 0.75
+    assert real_structure[1] == real_values[1]
+    assert real_structure[2] == real_values[2]
+
+
+def test_structure_set_copies_list() -> None:
+    solution_snapshot = solution.snapshot()
+    structure = solution_snapshot.get("SSI")
+    values = [1] * len(structure)
+
+    structure.set(values)
+    values[0] = 2
+
+    assert type(values[1]) is int
+    assert structure[0] == 1
+
+
+def test_structure_of_groups_append_dict() -> None:
+    random.seed(123)
+    group_domain = Domain()
+    group_domain.define_static_structure("S", 2)
+    group_domain.define_group("G")
+    group_domain.define_integer_in_group("G", "a", 0, 10)
+    group_domain.set_structure_to_variable("S", "G")
+    structure = Solution(group_domain).get("S")
+
+    structure.append({"a": 3})
+    structure.insert(0, {"a": 4})
+    structure[1] = {"a": 5}
+
+    assert len(structure) == 4
+    assert structure[0] == {"a": 4}
+    assert structure[1] == {"a": 5}
+    assert structure[-1] == {"a": 3}
+
+
+def test_structure_of_groups_set_dicts() -> None:
+    random.seed(123)
+    group_domain = Domain()
+    group_domain.define_static_structure("S", 2)
+    group_domain.define_group("G")
+    group_domain.define_integer_in_group("G", "a", 0, 10)
+    group_domain.set_structure_to_variable("S", "G")
+    group_solution = Solution(group_domain)
+
+    group_solution.get("S").set([{"a": 3}, {"a": 7}])
+
+    assert [component["a"] for component in group_solution.get("S").value] == [3, 7]
+
+    group_solution.set("S", [{"a": 1}, {"a": 2}])
+
+    assert [component["a"] for component in group_solution.get("S").value] == [1, 2]
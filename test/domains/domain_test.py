@@ -15,13 +15,17 @@
     along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
+import copy
 import pathlib
+import pickle
 
+import numpy as np
 import pytest
 from pytest_csv_params.decorator import csv_params
 
 from metagen.framework import Domain
 from metagen.framework.domain.core import (CategoricalDefinition,
+                                           DynamicStructureDefinition,
                                            IntegerDefinition, RealDefinition)
 from metagen.framework.solution.literals import CATEGORICAL, INTEGER, REAL
 
@@ -190,4 +194,122 @@ def test_define_categorical_domain_positive(variable: str, categories: str) -> N
         assert variable_definition.check_value(category)
 
     for category in categories:
-        assert not variable_definition.check_value(category+"$random_string%")
\ No newline at end of file
+        assert not variable_definition.check_value(category+"$random_string%")
+
+# ******** DEFINITION TESTS ********
+def test_define_variable_already_defined() -> None:
+    domain: Domain = Domain()
+    domain.define_integer("I", 0, 10)
+
+    with pytest.raises(ValueError, match=r"\[DEFINITION error\] The variable I is already defined."):
+        domain.define_integer("I", 0, 10)
+
+    with pytest.raises(ValueError, match=r"\[DEFINITION error\] The variable I is not a group."):
+        domain.define_integer_in_group("I", "J", 0, 10)
+
+
+# ******** STRUCTURE TESTS ********
+def test_numerical_structure_check_value() -> None:
+    integer_structure = DynamicStructureDefinition("S", IntegerDefinition(0, 10), 1, 5)
+    real_structure = DynamicStructureDefinition("S", RealDefinition(0.0, 1.0), 1, 5)
+
+    assert integer_structure.check_value([0, 5, 10])
+    assert not integer_structure.check_value([0, 5, 11])
+    assert not integer_structure.check_value([0, 5.0])
+    assert not integer_structure.check_value([0, 2 ** 70])
+    assert not integer_structure.check_value([])
+    assert real_structure.check_value([0.0, 0.5, 1.0])
+    assert not real_structure.check_value([-0.5, 0.5])
+    assert not real_structure.check_value([0.5, 1])
+
+
+def test_numerical_structure_check_value_nan() -> None:
+    real_definition = RealDefinition(0.0, 1.0)
+    real_structure = DynamicStructureDefinition("S", real_definition, 1, 5)
+
+    assert real_definition.check_value(float("nan"))
+    for values in ([0.5, float("nan")], [float("nan")]):
+        assert real_structure.check_value(values)
+        assert real_structure.check_value(np.array(values))
+    assert not real_structure.check_value([1.5, float("nan")])
+    assert not real_structure.check_value(np.array([1.5, np.nan]))
+
+
+def test_variable_items() -> None:
+    domain: Domain = Domain()
+    domain.define_integer("I", 0, 10)
+    domain.define_real("R", 0.0, 1.0)
+    core = domain.get_core()
+
+    assert [name for name, _ in core.variable_items()] == ["I", "R"]
+    assert core.variable_items() is core.variable_items()
+
+    domain.define_categorical("C", ["A", "B"])
+    assert [name for name, _ in core.variable_items()] == ["I", "R", "C"]
+    assert core.variable_items()[2][1] is core.get("C")
+
+
+def test_immutable_definitions() -> None:
+    integer_definition = IntegerDefinition(0, 10)
+
+    assert integer_definition == IntegerDefinition(0, 10)
+    assert integer_definition != IntegerDefinition(0, 11)
+    assert integer_definition != RealDefinition(0.0, 10.0)
+    assert len({CategoricalDefinition(["A", "B"]), CategoricalDefinition(["A", "B"])}) == 1
+
+    with pytest.raises(AttributeError):
+        integer_definition._IntegerDefinition__max_value = 20
+
+    assert copy.copy(integer_definition) is integer_definition
+    assert copy.deepcopy([integer_definition])[0] is integer_definition
+
+
+def test_pickle_domain() -> None:
+    domain = Domain()
+    domain.define_integer("I", 0, 10)
+    domain.define_static_structure("S", 3)
+    domain.set_structure_to_real("S", 0.0, 1.0)
+
+    loaded_domain = pickle.loads(pickle.dumps(domain))
+    core, loaded_core = domain.get_core(), loaded_domain.get_core()
+
+    assert str(loaded_domain) == str(domain)
+    assert loaded_core.variable_list() == core.variable_list()
+    assert loaded_core.get("I") == core.get("I")
+    assert loaded_core.get("S").get_base() == core.get("S").get_base()
+
+
+def test_define_many() -> None:
+    domain = Domain()
+    domain.define_many([("integer", "I", 0, 10),
+                        ("categorical", "C", ["A", "B"]),
+                        ("static_structure", "S", 3),
+                        ("structure_to_real", "S", 0.0, 1.0)])
+    core = domain.get_core()
+
+    assert core.variable_list() == ["I", "C", "S"]
+    assert core.get("I") == IntegerDefinition(0, 10)
+    assert core.get("S").get_base() == RealDefinition(0.0, 1.0)
+
+    with pytest.raises(ValueError):
+        domain.define_many([("integer", "J", 0, 10), ("unknown", "U")])
+    assert not core.is_variable("J")
+
+
+def test_define_many_link_and_override() -> None:
+    calls = []
+
+    class RecordingDomain(Domain):
+        __slots__ = ()
+
+        def define_integer(self, name, min_value, max_value, step=None):
+            calls.append(name)
+            super().define_integer(name, min_value, max_value, step)
+
+    domain = RecordingDomain()
+    domain.define_many([("group", "G"),
+                        ("integer", "I", 0, 10),
+                        ("link_variable_to_group", "G", "I")])
+
+    assert calls == ["I"]
+    assert domain.get_core().get("G").get("I") == IntegerDefinition(0, 10)
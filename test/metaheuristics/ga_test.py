@@ -0,0 +1,50 @@
+"""
+    Copyright (C) 2023 David Gutierrez Avilés and Manuel Jesús Jiménez Navarro
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import random
+
+from metagen.framework import Domain
+from metagen.metaheuristics.ga import GA, GAConnector, GASolution
+
+domain: Domain = Domain(GAConnector())
+domain.define_integer("x", -10, 10)
+domain.define_real("y", 0.0, 1.0)
+domain.define_categorical("c", ["A", "B", "C"])
+domain.define_static_structure("s", 3)
+domain.set_structure_to_integer("s", 0, 5)
+
+
+def fitness(solution: GASolution) -> float:
+    return abs(solution["x"]) + solution["y"] + sum(value.value for value in solution["s"])
+
+
+def test_ga_crossover() -> None:
+    random.seed(123)
+    parent1, parent2 = GASolution(domain), GASolution(domain)
+
+    child1, child2 = parent1.crossover(parent2)
+
+    for variable in ["x", "y", "c"]:
+        assert child1[variable] in (parent1[variable], parent2[variable])
+        assert child2[variable] in (parent1[variable], parent2[variable])
+    assert len(child1.get("s")) == len(child2.get("s")) == 3
+
+
+def test_ga_run() -> None:
+    random.seed(123)
+    solution = GA(domain, fitness, population_size=6, n_generations=3).run()
+
+    assert solution.fitness == fitness(solution)
@@ -0,0 +1,201 @@
+"""
+    Copyright (C) 2023 David Gutierrez Avilés and Manuel Jesús Jiménez Navarro
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from metagen.framework import Domain, Solution
+from metagen.metaheuristics import RandomSearch
+from metagen.metaheuristics.random import random_search
+
+domain: Domain = Domain()
+domain.define_integer("x", -10, 10)
+domain.define_real("y", 0.0, 1.0)
+
+
+def fitness(solution: Solution) -> float:
+    return abs(solution["x"]) + solution["y"]
+
+
+def test_random_search_sequential() -> None:
+    random.seed(123)
+    solution = RandomSearch(domain, fitness, search_space_size=10, iterations=5).run()
+
+    assert solution.fitness == fitness(solution)
+
+
+def test_random_search_independent_results() -> None:
+    random.seed(123)
+    search = RandomSearch(domain, fitness, search_space_size=10, iterations=5)
+
+    first = search.run()
+    first_snapshot = first.snapshot()
+    second = search.run()
+
+    assert first is not second
+    assert first is not search.best_solution and second is not search.best_solution
+    assert first == first_snapshot and first.fitness == first_snapshot.fitness
+
+
+def test_random_search_best_initial_solution() -> None:
+    random.seed(123)
+    np.random.seed(123)
+    evaluated = []
+
+    def recording_fitness(solution: Solution) -> float:
+        evaluated.append(solution.snapshot())
+        return fitness(solution)
+
+    # Without iterations, the best solution can only come from the initial population
+    solution = RandomSearch(domain, recording_fitness, search_space_size=10, iterations=0).run()
+
+    assert len(evaluated) == 10
+    assert solution.fitness == min(fitness(initial) for initial in evaluated)
+    assert solution in evaluated
+
+    solution = RandomSearch(domain, vectorized_fitness, search_space_size=10, iterations=0, vectorized=True).run()
+
+    assert solution.fitness == fitness(solution)
+
+
+def test_random_search_executor() -> None:
+    random.seed(123)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        search = RandomSearch(domain, fitness, search_space_size=10, iterations=5, executor=executor)
+        solution = search.run()
+
+        assert search.executor is executor
+        assert executor.submit(abs, -1).result() == 1
+
+    assert solution.fitness == fitness(solution)
+
+
+def test_random_search_n_jobs() -> None:
+    random.seed(123)
+    search = RandomSearch(domain, fitness, search_space_size=10, iterations=5, n_jobs=2)
+    solution = search.run()
+
+    assert solution.fitness == fitness(solution)
+    assert search.executor is None
+
+
+def test_random_search_n_jobs_matches_sequential() -> None:
+    random.seed(123)
+    sequential = RandomSearch(domain, fitness, search_space_size=10, iterations=5).run()
+    random.seed(123)
+    parallel = RandomSearch(domain, fitness, search_space_size=10, iterations=5, n_jobs=2).run()
+
+    assert parallel["x"] == sequential["x"]
+    assert parallel["y"] == sequential["y"]
+    assert parallel.fitness == sequential.fitness
+
+
+def test_random_search_n_jobs_zero() -> None:
+    with pytest.raises(ValueError):
+        RandomSearch(domain, fitness, n_jobs=0)
+
+
+def vectorized_fitness(batch: np.ndarray) -> np.ndarray:
+    return np.abs(batch[:, 0]) + batch[:, 1]
+
+
+def test_random_search_vectorized() -> None:
+    random.seed(123)
+    np.random.seed(123)
+    solution = RandomSearch(domain, vectorized_fitness, search_space_size=10, iterations=5, vectorized=True).run()
+
+    assert solution.fitness == fitness(solution)
+
+
+def test_random_search_vectorized_categorical() -> None:
+    random.seed(123)
+    categorical_domain: Domain = Domain()
+    categorical_domain.define_integer("x", -10, 10)
+    categorical_domain.define_real("y", 0.0, 1.0)
+    categorical_domain.define_categorical("c", ["A", "B"])
+
+    search = RandomSearch(categorical_domain, vectorized_fitness, search_space_size=10, iterations=5, vectorized=True)
+
+    with pytest.raises(ValueError):
+        search.run()
+
+    with pytest.raises(ValueError):
+        search.run_islands(2)
+
+
+structure_domain: Domain = Domain()
+structure_domain.define_integer("x", -10, 10)
+structure_domain.define_static_structure("s", 3)
+structure_domain.set_structure_to_real("s", 0.0, 1.0)
+
+
+def structure_fitness(solution: Solution) -> float:
+    return abs(solution["x"]) + sum(component.value for component in solution["s"])
+
+
+def vectorized_structure_fitness(batch: np.ndarray) -> np.ndarray:
+    return np.abs(batch[:, 0]) + batch[:, 1:].sum(axis=1)
+
+
+def test_random_search_vectorized_structure() -> None:
+    random.seed(123)
+    np.random.seed(123)
+    search = RandomSearch(structure_domain, vectorized_structure_fitness, search_space_size=10, iterations=4,
+                          vectorized=True)
+
+    solution = search.run()
+    assert solution.fitness == pytest.approx(structure_fitness(solution))
+
+    solution = search.run_islands(2, migrations=2)
+    assert solution.fitness == pytest.approx(structure_fitness(solution))
+
+
+def test_random_search_islands() -> None:
+    random.seed(123)
+    search = RandomSearch(domain, fitness, search_space_size=10, iterations=6)
+
+    solution = search.run_islands(2)
+    assert solution.fitness == fitness(solution)
+
+    solution = search.run_islands(2, migrations=3)
+    assert solution.fitness == fitness(solution)
+
+
+def constant_fitness(solution: Solution) -> float:
+    return 0.0
+
+
+def test_random_search_islands_migrant(monkeypatch: pytest.MonkeyPatch) -> None:
+    random.seed(123)
+    migrants = []
+    run_island = random_search._run_island
+
+    def recording_run_island(*args):
+        migrants.append(args[-1])
+        return run_island(*args)
+
+    # The islands are run in threads, so the migrant sent in each round can be recorded
+    monkeypatch.setattr(random_search, "ProcessPoolExecutor", ThreadPoolExecutor)
+    monkeypatch.setattr(random_search, "_run_island", recording_run_island)
+    search = RandomSearch(domain, constant_fitness, search_space_size=10, iterations=6)
+
+    search.run_islands(2, migrations=3)
+
+    # Only the first round improves the best fitness, so the migrant is only sent in the second round
+    assert [migrant is None for migrant in migrants] == [True, True, False, False, True, True]
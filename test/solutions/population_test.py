@@ -0,0 +1,155 @@
+"""
+    Copyright (C) 2023 David Gutierrez Avilés and Manuel Jesús Jiménez Navarro
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import numpy as np
+import pytest
+
+from metagen.framework import Domain
+from metagen.framework.solution import Population
+
+domain: Domain = Domain()
+domain.define_integer("x", 0, 10, 2)
+domain.define_real("y", 0.0, 1.0)
+domain.define_categorical("c", ["A", "B", "C"])
+
+
+def test_population_values() -> None:
+    np.random.seed(123)
+    population = Population(domain, 20)
+
+    for _ in range(5):
+        population.mutate()
+
+        assert np.all(population.vars["x"] % 2 == 0)
+        assert np.all((population.vars["x"] >= 0) & (population.vars["x"] <= 10))
+        assert np.all((population.vars["y"] >= 0.0) & (population.vars["y"] <= 1.0))
+        assert np.all((population.vars["c"] >= 0) & (population.vars["c"] < 3))
+
+
+def test_population_solution() -> None:
+    np.random.seed(123)
+    population = Population(domain, 20)
+    population.fitness[:] = population.vars["y"]
+
+    i = population.best()
+    solution = population.solution(i)
+
+    assert solution["x"] == population.vars["x"][i]
+    assert solution["y"] == population.vars["y"][i]
+    assert solution["c"] == ["A", "B", "C"][population.vars["c"][i]]
+    assert solution.get_fitness() == population.vars["y"].min()
+
+
+def test_population_matrix_categorical() -> None:
+    with pytest.raises(ValueError):
+        Population(domain, 20).to_matrix()
+
+
+def test_population_matrix() -> None:
+    numerical_domain: Domain = Domain()
+    numerical_domain.define_integer("x", 0, 10)
+    numerical_domain.define_real("y", 0.0, 1.0)
+    population = Population(numerical_domain, 20)
+
+    matrix = population.to_matrix()
+
+    assert matrix.shape == (20, 2)
+    assert np.shares_memory(matrix, population.vars["x"])
+    assert np.array_equal(matrix[:, 1], population.vars["y"])
+    assert population.vars["x"].flags["C_CONTIGUOUS"]
+
+
+def test_population_structures() -> None:
+    np.random.seed(123)
+    structure_domain: Domain = Domain()
+    structure_domain.define_real("y", 0.0, 1.0)
+    structure_domain.define_static_structure("s", 4)
+    structure_domain.set_structure_to_integer("s", 0, 10)
+    structure_domain.define_static_structure("t", 3)
+    structure_domain.set_structure_to_categorical("t", ["A", "B"])
+    population = Population(structure_domain, 20)
+
+    for _ in range(5):
+        population.mutate()
+
+        assert population.vars["s"].shape == (20, 4)
+        assert np.all((population.vars["s"] >= 0) & (population.vars["s"] <= 10))
+        assert np.all((population.vars["t"] >= 0) & (population.vars["t"] < 2))
+
+    solution = population.solution(7)
+
+    assert [solution["s"][i].value for i in range(4)] == population.vars["s"][7].tolist()
+    assert [solution["t"][i].value for i in range(3)] == [["A", "B"][c] for c in population.vars["t"][7]]
+
+    population.put(0, solution)
+
+    assert np.array_equal(population.vars["s"][0], population.vars["s"][7])
+    assert np.array_equal(population.vars["t"][0], population.vars["t"][7])
+
+    numerical_domain: Domain = Domain()
+    numerical_domain.define_real("y", 0.0, 1.0)
+    numerical_domain.define_static_structure("s", 4)
+    numerical_domain.set_structure_to_real("s", 0.0, 1.0)
+    population = Population(numerical_domain, 20)
+
+    assert population.to_matrix().shape == (20, 5)
+    assert np.shares_memory(population.to_matrix(), population.vars["s"])
+
+
+def test_population_crossover() -> None:
+    np.random.seed(123)
+    structure_domain: Domain = Domain()
+    structure_domain.define_categorical("c", ["A", "B", "C"])
+    structure_domain.define_static_structure("s", 4)
+    structure_domain.set_structure_to_integer("s", 0, 10)
+    population = Population(structure_domain, 20)
+    parents = {variable: values.copy() for variable, values in population.vars.items()}
+    first, second = np.random.randint(0, 20, size=20), np.random.randint(0, 20, size=20)
+
+    population.crossover(first, second)
+
+    for variable, values in parents.items():
+        child = population.vars[variable]
+        assert np.all((child == values[first]) | (child == values[second]))
+    assert [population.solution(0)["s"][i].value for i in range(4)] == population.vars["s"][0].tolist()
+    assert np.all(population.fitness == population.fitness[0])
+
+
+def test_population_put() -> None:
+    np.random.seed(123)
+    population = Population(domain, 20)
+    solution = population.solution(3)
+    solution.set_fitness(1.5)
+
+    population.put(10, solution)
+
+    for variable in ["x", "y", "c"]:
+        assert population.vars[variable][10] == population.vars[variable][3]
+    assert population.fitness[10] == 1.5
+    assert population.solution(10) == solution
+
+
+def test_population_unique() -> None:
+    np.random.seed(123)
+    population = Population(domain, 20)
+    population.put(5, population.solution(2))
+    population.put(9, population.solution(2))
+
+    unique = population.unique()
+
+    assert 2 in unique and 5 not in unique and 9 not in unique
+    solutions = [population.solution(i) for i in unique]
+    assert all(a != b for i, a in enumerate(solutions) for b in solutions[i + 1:])
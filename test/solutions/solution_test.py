@@ -16,11 +16,17 @@
 """
 import json
 import pathlib
+import random
 import sys
 import pytest
 from pytest_csv_params.decorator import csv_params
 from os import path
 
+import numpy as np
+
+from metagen.framework import Domain, Solution
+from metagen.framework.solution import Population
+
 sys.path.append(path.dirname(path.dirname(path.abspath(__file__))))
 from utils import solution
 
@@ -97,3 +103,145 @@ def test_define_integer_domain_negative_common_mistakes() -> None:
 
     with pytest.raises(ValueError):
         solution.set("L", {"ER": value})
+
+
+def test_set_after_redefinition() -> None:
+    domain = Domain()
+    domain.define_integer("x", 0, 10)
+    redefined = Solution(domain)
+    redefined.set("x", 5)
+
+    domain.get_core().delete("x")
+    domain.define_integer("x", 20, 30)
+    redefined.set("x", 25)
+
+    assert redefined.get("x").value == 25
+    assert redefined.get("x").get_definition().get_attributes()[1:3] == (20, 30)
+
+
+def test_from_vector_in_place() -> None:
+    domain = Domain()
+    domain.define_integer("x", 0, 10)
+    domain.define_real("y", 0.0, 1.0)
+    vector_solution = Solution(domain)
+    x = vector_solution.get("x")
+
+    vector_solution.from_vector(np.array([3.0, 0.5]))
+
+    assert vector_solution.get("x") is x
+    assert vector_solution["x"] == 3 and isinstance(vector_solution["x"], int)
+    assert vector_solution.to_vector().tolist() == [3.0, 0.5]
+
+    matrix = np.zeros((2, 2))
+    row = matrix[1]
+    assert vector_solution.to_vector(out=row) is row
+    assert matrix.tolist() == [[0.0, 0.0], [3.0, 0.5]]
+
+    with pytest.raises(ValueError):
+        vector_solution.from_vector(np.array([30.0, 0.5]))
+
+
+def test_from_vector_structure() -> None:
+    domain = Domain()
+    domain.define_integer("x", 0, 10)
+    domain.define_static_structure("s", 3)
+    domain.set_structure_to_integer("s", 0, 10)
+    vector_solution = Solution(domain)
+    components = list(vector_solution.get("s").value)
+
+    vector_solution.from_vector(np.array([3.0, 4.0, 5.0, 6.0]))
+
+    assert vector_solution["x"] == 3
+    assert [component.value for component in vector_solution.get("s").value] == [4, 5, 6]
+    assert all(isinstance(component.value, int) for component in vector_solution.get("s").value)
+    assert all(a is b for a, b in zip(vector_solution.get("s").value, components))
+
+    with pytest.raises(ValueError):
+        vector_solution.from_vector(np.array([3.0, 4.0]))
+
+    with pytest.raises(ValueError):
+        vector_solution.from_vector(np.array([3.0, 4.0, 5.0, 60.0]))
+
+
+def test_vector_round_trip_structure() -> None:
+    random.seed(123)
+    domain = Domain()
+    domain.define_integer("x", 0, 10)
+    domain.define_static_structure("s", 3)
+    domain.set_structure_to_real("s", 0.0, 1.0)
+    vector_solution = Solution(domain)
+    other_solution = Solution(domain)
+
+    vector = vector_solution.to_vector()
+    other_solution.from_vector(vector)
+
+    assert len(vector) == 4
+    assert other_solution == vector_solution
+    assert other_solution.to_vector().tolist() == vector.tolist()
+
+    population = Population(domain, 2)
+    population.put(0, vector_solution)
+
+    assert population.to_matrix()[0].tolist() == vector.tolist()
+
+
+def test_set_subclass_override() -> None:
+    calls = []
+
+    class RecordingSolution(Solution):
+        __slots__ = ()
+
+        def _set_builtin(self, variable, value):
+            calls.append(variable)
+            super()._set_builtin(variable, value)
+
+    domain = Domain()
+    domain.define_integer("x", 0, 10)
+    recording_solution = RecordingSolution(domain)
+
+    recording_solution.set("x", 3)
+    recording_solution.set_values({"x": 4})
+
+    assert calls == ["x", "x"]
+    assert recording_solution["x"] == 4
+
+
+def test_set_values() -> None:
+    solution.set_values({"I": 3, "R": 0.5})
+
+    assert solution["I"] == 3
+    assert solution["R"] == 0.5
+
+    with pytest.raises(ValueError):
+        solution.set_values({"I": 3, "THISVALUEDOESNOTEXISTS": 1})
+
+
+def test_hash_consistent_with_eq() -> None:
+    solution_snapshot = solution.snapshot()
+    solution_snapshot.set_fitness(solution.get_fitness() + 1.0)
+
+    assert solution_snapshot == solution
+    assert hash(solution_snapshot) == hash(solution)
+    assert len({solution, solution_snapshot}) == 1
+
+
+def test_contains() -> None:
+    assert "I" in solution
+    assert "THISVALUEDOESNOTEXISTS" not in solution
+
+
+def test_no_instance_dict() -> None:
+    assert not hasattr(solution, "__dict__")
+    assert not any(hasattr(value, "__dict__") for value in solution.values())
+
+
+def test_sort_population() -> None:
+    population = [solution.snapshot() for _ in range(4)]
+    for individual, fitness in zip(population, [3.0, 1.0, 2.0, 1.0]):
+        individual.set_fitness(fitness)
+
+    sorted_population = Solution.sort_population(population)
+
+    assert [id(individual) for individual in sorted_population] == \
+           [id(individual) for individual in sorted(population, key=lambda individual: individual.fitness)]
+    assert [individual.fitness for individual in sorted_population] == [1.0, 1.0, 2.0, 3.0]